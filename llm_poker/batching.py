@@ -0,0 +1,160 @@
+# llm_poker/batching.py
+
+import json
+import threading
+import time
+import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import llm
+
+# dispatch(model_id, prompts) -> one result per prompt, in order: the
+# response text, or the exception that prompt failed with. An exception
+# raised by dispatch itself fails the whole batch.
+Dispatch = Callable[[str, List[str]], List[Union[str, Exception]]]
+
+
+def concurrent_dispatch(max_workers: int = 256) -> Dispatch:
+    """
+    Default dispatch through the `llm` library, which has no batch call:
+    the prompts of one batch are sent concurrently on a shared pool.
+    """
+    pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm-batch")
+    models: Dict[str, llm.Model] = {}
+    models_lock = threading.Lock()
+
+    def prompt_one(model_id: str, text: str) -> str:
+        with models_lock:
+            model = models.get(model_id)
+            if model is None:
+                model = models[model_id] = llm.get_model(model_id)
+        return model.prompt(text).text()
+
+    def dispatch(model_id: str, prompts: List[str]) -> List[Union[str, Exception]]:
+        futures = [pool.submit(prompt_one, model_id, text) for text in prompts]
+        results: List[Union[str, Exception]] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+        return results
+
+    return dispatch
+
+
+def completions_dispatch(base_url: str, max_tokens: int = 1024, timeout: float = 300.0) -> Dispatch:
+    """
+    Send each batch as a single request to an OpenAI-compatible
+    /v1/completions endpoint that accepts a list of prompts (e.g. a local
+    vLLM or llama.cpp server), which batches them on the accelerator.
+    """
+    url = base_url.rstrip("/") + "/v1/completions"
+
+    def dispatch(model_id: str, prompts: List[str]) -> List[Union[str, Exception]]:
+        body = json.dumps({"model": model_id, "prompt": prompts, "max_tokens": max_tokens}).encode("utf-8")
+        req = urllib.request.Request(url, data=body, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            data = json.loads(resp.read().decode("utf-8"))
+        texts: Dict[int, str] = {choice["index"]: choice["text"] for choice in data["choices"]}
+        missing = [i for i in range(len(prompts)) if i not in texts]
+        if missing:
+            raise RuntimeError(f"{url} returned no completion for prompt(s) {missing} of {len(prompts)}")
+        return [texts[i] for i in range(len(prompts))]
+
+    return dispatch
+
+
+class PromptBatcher:
+    """
+    Collects prompts per model for up to `window` seconds, or until
+    `max_batch` are pending, then sends them together through `dispatch`
+    and resolves each caller's future with its own response.
+
+    Meant to be shared by LLMPlayers on many concurrently running tables,
+    so that decisions for the same model are batched across tables.
+    """
+
+    def __init__(
+        self,
+        dispatch: Optional[Dispatch] = None,
+        window: float = 0.05,
+        max_batch: int = 32,
+        max_concurrent_batches: int = 8,
+    ):
+        # The default dispatch gets one thread per prompt that can be in
+        # flight, so it never caps throughput below the batcher's own limit.
+        self.dispatch = dispatch or concurrent_dispatch(max_workers=max_batch * max_concurrent_batches)
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, List[Tuple[str, Future]]] = {}
+        self._deadlines: Dict[str, float] = {}
+        self._cond = threading.Condition()
+        self._closed = False
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrent_batches, thread_name_prefix="batch-flush")
+        self._thread = threading.Thread(target=self._run, name="prompt-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, model_id: str, prompt: str) -> Future:
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("PromptBatcher is closed")
+            batch = self._pending.setdefault(model_id, [])
+            if not batch:
+                self._deadlines[model_id] = time.monotonic() + self.window
+            batch.append((prompt, future))
+            if len(batch) >= self.max_batch:
+                self._deadlines[model_id] = 0.0
+            self._cond.notify()
+        return future
+
+    def prompt(self, model_id: str, prompt: str) -> str:
+        """Blocking helper: submit and wait for this prompt's response text."""
+        return self.submit(model_id, prompt).result()
+
+    def close(self) -> None:
+        """Flush anything still pending and stop the background thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._pool.shutdown(wait=True)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    due = [m for m, d in self._deadlines.items() if d <= now or self._closed]
+                    if due:
+                        break
+                    if self._closed:
+                        return
+                    timeout = min(self._deadlines.values()) - now if self._deadlines else None
+                    self._cond.wait(timeout)
+                batches = []
+                for model_id in due:
+                    batches.append((model_id, self._pending.pop(model_id)))
+                    del self._deadlines[model_id]
+            for model_id, batch in batches:
+                for start in range(0, len(batch), self.max_batch):
+                    self._pool.submit(self._flush, model_id, batch[start:start + self.max_batch])
+
+    def _flush(self, model_id: str, batch: List[Tuple[str, Future]]) -> None:
+        try:
+            results = self.dispatch(model_id, [prompt for prompt, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"Batch dispatch for {model_id} returned {len(results)} results for {len(batch)} prompts")
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        # Each caller gets its own outcome; one failed prompt does not fail
+        # decisions on unrelated tables.
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
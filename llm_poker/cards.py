@@ -0,0 +1,93 @@
+# llm_poker/cards.py
+
+import itertools
+from collections import Counter
+from typing import List
+
+RANKS = list(range(2, 15))  # 2..14 => 2..Ace
+SUITS = ["♣", "♦", "♥", "♠"]
+
+# Cards are ints 0..51: rank = card // 4 + 2, suit = SUITS[card % 4].
+# They are only rendered as strings like '14♥' for logs and prompts.
+
+def create_deck() -> List[int]:
+    return list(range(52))
+
+def deal(deck: List[int], n: int) -> List[int]:
+    cards = deck[:n]
+    del deck[:n]
+    return cards
+
+def card_rank(card: int) -> int:
+    # e.g. 50 => 14
+    return (card >> 2) + 2
+
+def card_suit(card: int) -> str:
+    # e.g. 50 => '♥'
+    return SUITS[card & 3]
+
+def card_str(card: int) -> str:
+    return f"{card_rank(card)}{card_suit(card)}"
+
+def format_cards(cards: List[int]) -> List[str]:
+    return [card_str(c) for c in cards]
+
+def parse_card(text: str) -> int:
+    # e.g. '14♥' => 50
+    return (int(text[:-1]) - 2) * 4 + SUITS.index(text[-1])
+
+
+def score_best_5_of_7(cards: List[int]) -> tuple:
+    """
+    Minimal 7->5 card evaluator returning a comparable tuple: (category, freq_pattern, rank_pattern, sorted_ranks).
+    8=straight flush, 7=quads, 6=full house, 5=flush, 4=straight,
+    3=trips, 2=two pair, 1=pair, 0=high card.
+    """
+    def rank_5_cards(hand: List[int]) -> tuple:
+        ranks = sorted([card_rank(c) for c in hand], reverse=True)
+        suits = [card_suit(c) for c in hand]
+        is_flush = (len(set(suits)) == 1)
+
+        def is_straight(sorted_r: List[int]) -> bool:
+            for i in range(len(sorted_r) - 1):
+                if sorted_r[i] - sorted_r[i+1] != 1:
+                    return False
+            return True
+
+        straight = is_straight(ranks)
+
+        ccount = Counter(ranks)
+        freq_sorted = sorted(ccount.items(), key=lambda x: (x[1], x[0]), reverse=True)
+        freq_pattern = [x[1] for x in freq_sorted]
+        rank_pattern = [x[0] for x in freq_sorted]
+
+        cat = 0
+        if straight and is_flush:
+            cat = 8
+        elif 4 in freq_pattern:
+            cat = 7
+        elif sorted(freq_pattern) == [2,3]:
+            cat = 6
+        elif is_flush:
+            cat = 5
+        elif straight:
+            cat = 4
+        elif 3 in freq_pattern:
+            cat = 3
+        else:
+            pair_count = freq_pattern.count(2)
+            if pair_count == 2:
+                cat = 2
+            elif pair_count == 1:
+                cat = 1
+            else:
+                cat = 0
+
+        return (cat, freq_pattern, rank_pattern, ranks)
+
+    best_val = (0, [], [], [])
+    for combo in itertools.combinations(cards, 5):
+        val = rank_5_cards(list(combo))
+        if val > best_val:
+            best_val = val
+    return best_val
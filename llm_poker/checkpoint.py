@@ -0,0 +1,89 @@
+# llm_poker/checkpoint.py
+
+import json
+import os
+import random
+import tempfile
+from typing import Dict, List, Optional
+from .human_player import HumanPlayer
+
+CHECKPOINT_VERSION = 1
+
+
+def save_checkpoint(path: str, state: Dict) -> None:
+    """
+    Atomically write a session checkpoint as JSON.
+    The state is written to a temp file in the same directory, fsynced and
+    then renamed over the target, so a crash never leaves a torn file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=".llm_poker_", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(state, fh)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str) -> Optional[Dict]:
+    """Return the checkpoint stored at path, or None if there is none."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as fh:
+        state = json.load(fh)
+    if state.get("version") != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}: {state.get('version')}")
+    return state
+
+
+def capture_session(table, hand_number: int, stats=None, starting_stack: Optional[int] = None) -> Dict:
+    """
+    Snapshot everything needed to continue a session at the next hand:
+    seats and stacks, button position, RNG state, hand counter and stats.
+    """
+    players: List[Dict] = []
+    for p in table.players:
+        players.append({
+            "name": p.name,
+            "model_id": getattr(p, "model_id", None),
+            "stack": p.stack,
+            "human": isinstance(p, HumanPlayer),
+        })
+    version, internal, gauss_next = random.getstate()
+    return {
+        "version": CHECKPOINT_VERSION,
+        "hand_number": hand_number,
+        "button_position": table.button_position,
+        "rng_state": [version, list(internal), gauss_next],
+        "players": players,
+        "stats": stats.state() if stats is not None else {},
+        "starting_stack": starting_stack,
+    }
+
+
+def resume_mismatches(state: Dict, model_names: List[str], human_player: bool, starting_stack: int) -> List[str]:
+    """
+    Describe the session options that differ from the checkpoint and will
+    therefore be ignored on resume (the saved seats always win).
+    """
+    saved_models = [seat["model_id"] for seat in state["players"] if not seat["human"]]
+    saved_human = any(seat["human"] for seat in state["players"])
+    saved_stack = state.get("starting_stack")
+    mismatches = []
+    if list(model_names) != saved_models:
+        mismatches.append(f"models {' '.join(model_names)!r} (checkpoint has {' '.join(saved_models)!r})")
+    if human_player != saved_human:
+        mismatches.append(f"human player {human_player} (checkpoint has {saved_human})")
+    if saved_stack is not None and starting_stack != saved_stack:
+        mismatches.append(f"starting stack {starting_stack} (checkpoint has {saved_stack})")
+    return mismatches
+
+
+def restore_rng(state: Dict) -> None:
+    version, internal, gauss_next = state["rng_state"]
+    random.setstate((version, tuple(internal), gauss_next))
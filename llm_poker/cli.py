@@ -1,7 +1,7 @@
 # llm_poker/cli.py
 
 import click
-from llm_poker.environment import simulate_poker_game
+from llm_poker.environment import simulate_poker_game, simulate_poker_tables
 
 @click.command()
 @click.option("--models", "-m", default="gpt-5", help="Space-separated model names.")
@@ -9,23 +9,60 @@ from llm_poker.environment import simulate_poker_game
 @click.option("--elimination-count", "-e", default=1, help="Stop when only this many players remain.")
 @click.option("--stack", "-s", default=10000, help="Starting stack for each player.")
 @click.option("--human-player", "-h", is_flag=True, help="Whether to include a human player", default=False)
-def main(models, rounds, elimination_count, stack, human_player):
+@click.option("--checkpoint", "-c", default=None, type=click.Path(dir_okay=False), help="Save session state to this file after every hand.")
+@click.option("--resume", is_flag=True, default=False, help="Continue the session saved in --checkpoint.")
+@click.option("--speculate", is_flag=True, default=False, help="Prefetch the next LLM decision assuming a call (may spend extra requests).")
+@click.option("--tables", "-t", default=1, help="Play this many tables of the same line-up concurrently.")
+@click.option("--batch-window", default=0.05, help="Seconds to collect same-model prompts across tables before sending.")
+@click.option("--max-tables", default=10000, help="Most tables kept in memory at once when --tables > 1.")
+@click.option("--workers", default=64, help="Hands played at once when --tables > 1; this bounds pending LLM decisions.")
+@click.option("--memory-budget", default=None, type=int, help="Cap tables in memory to fit this many MB when --tables > 1.")
+@click.option("--record", default=None, type=click.Path(dir_okay=False), help="Append every decision to this JSON-lines file for llm_poker_grade.")
+@click.option("--batch-endpoint", default=None, help="Send each batch as one request to this OpenAI-compatible completions server (e.g. http://localhost:8000).")
+def main(models, rounds, elimination_count, stack, human_player, checkpoint, resume, speculate, tables, batch_window, max_tables, workers, memory_budget, record, batch_endpoint):
     """
     CLI to run a multi-LLM Texas Hold'em simulation.
     Example:
       llm_poker --models gpt-4o deepseek-chat --rounds 5
     """
+    if resume and not checkpoint:
+        raise click.UsageError("--resume requires --checkpoint PATH.")
+    multi_table = tables > 1 or batch_endpoint is not None
+    if multi_table and (human_player or checkpoint):
+        raise click.UsageError("--tables and --batch-endpoint cannot be combined with --human-player or --checkpoint.")
+
     model_list = models.strip().split()
     # If user doesn’t supply anything, fall back to a modern default
     if not model_list:
         model_list = ["gpt-5"]
 
+    if multi_table:
+        simulate_poker_tables(
+            model_names=model_list,
+            tables=tables,
+            rounds=rounds,
+            elimination_count=elimination_count,
+            starting_stack=stack,
+            batch_window=batch_window,
+            speculate=speculate,
+            max_tables=max_tables,
+            workers=workers,
+            memory_budget=memory_budget * 1024 * 1024 if memory_budget else None,
+            record_path=record,
+            batch_endpoint=batch_endpoint,
+        )
+        return
+
     simulate_poker_game(
         model_names=model_list,
         rounds=rounds,
         elimination_count=elimination_count,
         starting_stack=stack,
         human_player=human_player,
+        checkpoint_path=checkpoint,
+        resume=resume,
+        speculate=speculate,
+        record_path=record,
     )
 
 if __name__ == "__main__":
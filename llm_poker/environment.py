@@ -1,115 +1,109 @@
 # llm_poker/environment.py
 
 import random
-import itertools
-from typing import List, Dict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Callable, Optional
 from .llm_player import LLMPlayer
 from .human_player import HumanPlayer
+from .stats import StatsTracker
+from .checkpoint import save_checkpoint, load_checkpoint, capture_session, restore_rng, resume_mismatches
+from .batching import PromptBatcher, completions_dispatch
+from .grading import DecisionRecorder
+from .cards import create_deck, deal, format_cards, score_best_5_of_7
 
-RANKS = list(range(2, 15))  # 2..14 => 2..Ace
-SUITS = ["♣", "♦", "♥", "♠"]
-
-def create_deck() -> List[str]:
-    return [f"{r}{s}" for r in RANKS for s in SUITS]
-
-def deal(deck: List[str], n: int) -> List[str]:
-    cards = deck[:n]
-    del deck[:n]
-    return cards
-
-def card_rank(card: str) -> int:
-    # e.g. '14♥' => 14
-    for i, ch in enumerate(card):
-        if ch in SUITS:
-            return int(card[:i])
-    return 0
-
-def card_suit(card: str) -> str:
-    # e.g. '14♥' => '♥'
-    for ch in card:
-        if ch in SUITS:
-            return ch
-    return "?"
-
-
-def score_best_5_of_7(cards: List[str]) -> tuple:
-    """
-    Minimal 7->5 card evaluator returning a comparable tuple: (category, freq_pattern, rank_pattern, sorted_ranks).
-    8=straight flush, 7=quads, 6=full house, 5=flush, 4=straight,
-    3=trips, 2=two pair, 1=pair, 0=high card.
-    """
-    import itertools
-    from collections import Counter
-
-    def rank_5_cards(hand: List[str]) -> tuple:
-        ranks = sorted([card_rank(c) for c in hand], reverse=True)
-        suits = [card_suit(c) for c in hand]
-        is_flush = (len(set(suits)) == 1)
-
-        def is_straight(sorted_r: List[int]) -> bool:
-            for i in range(len(sorted_r) - 1):
-                if sorted_r[i] - sorted_r[i+1] != 1:
-                    return False
-            return True
-
-        straight = is_straight(ranks)
-
-        ccount = Counter(ranks)
-        freq_sorted = sorted(ccount.items(), key=lambda x: (x[1], x[0]), reverse=True)
-        freq_pattern = [x[1] for x in freq_sorted]
-        rank_pattern = [x[0] for x in freq_sorted]
-
-        cat = 0
-        if straight and is_flush:
-            cat = 8
-        elif 4 in freq_pattern:
-            cat = 7
-        elif sorted(freq_pattern) == [2,3]:
-            cat = 6
-        elif is_flush:
-            cat = 5
-        elif straight:
-            cat = 4
-        elif 3 in freq_pattern:
-            cat = 3
-        else:
-            pair_count = freq_pattern.count(2)
-            if pair_count == 2:
-                cat = 2
-            elif pair_count == 1:
-                cat = 1
-            else:
-                cat = 0
-
-        return (cat, freq_pattern, rank_pattern, ranks)
-
-    best_val = (0, [], [], [])
-    for combo in itertools.combinations(cards, 5):
-        val = rank_5_cards(list(combo))
-        if val > best_val:
-            best_val = val
-    return best_val
+# Worker threads per table for speculative requests, created per hand.
+SPECULATION_WORKERS = 2
 
 
 class PokerTable:
     """
     Minimal environment with blinds, multi-raise logic, local showdown scoring.
     No side pots or advanced all-in tracking beyond forced folding if short.
+
+    Listeners are callables invoked as listener(event, payload) while a hand
+    is played; events are "hand_start", "action", "showdown" and "hand_end",
+    and every payload carries the emitting table under "table".
+    "action" payloads also carry the decision's inputs (pot_before,
+    community_cards, opponents, min_raise) and the requested action, which
+    differs from "action" when a player could not afford a call or raise.
+
+    With speculate=True, while one player decides, the next player's request
+    is started early assuming the current player calls. The early result is
+    only used if the next player's actual inputs match the assumed ones;
+    otherwise it is cancelled or discarded. Only players whose
+    supports_speculation is True are prefetched.
     """
 
-    def __init__(self, players, min_raise=500, small_blind=100, big_blind=200):
+    __slots__ = (
+        "players", "min_raise", "small_blind", "big_blind", "deck", "button_position",
+        "listeners", "speculate", "speculation_hits", "speculation_misses", "_speculation_pool",
+        "_speculating",
+    )
+
+    def __init__(
+        self,
+        players,
+        min_raise=500,
+        small_blind=100,
+        big_blind=200,
+        listeners: Optional[List[Callable[[str, Dict], None]]] = None,
+        speculate: bool = False,
+    ):
         self.players = players
         self.min_raise = min_raise
         self.small_blind = small_blind
         self.big_blind = big_blind
-        self.deck: List[str] = []
+        self.deck: List[int] = []
         self.button_position = 0
+        self.listeners = list(listeners or [])
+        self.speculate = speculate
+        self.speculation_hits = 0
+        self.speculation_misses = 0
+        self._speculation_pool: Optional[ThreadPoolExecutor] = None
+        self._speculating: List[Future] = []
+
+    def _emit(self, event: str, **payload) -> None:
+        payload["table"] = self
+        for listener in self.listeners:
+            listener(event, payload)
+
+    def _speculation_busy(self) -> bool:
+        # A cancelled request that already started keeps its worker until it
+        # returns; never queue a speculation behind such requests.
+        self._speculating = [f for f in self._speculating if not f.done()]
+        return len(self._speculating) >= SPECULATION_WORKERS
+
+    def _speculate(self, player, inputs: Dict) -> Future:
+        if self._speculation_pool is None:
+            self._speculation_pool = ThreadPoolExecutor(
+                max_workers=SPECULATION_WORKERS, thread_name_prefix="speculate",
+            )
+        future = self._speculation_pool.submit(player.request_action, **inputs)
+        self._speculating.append(future)
+        return future
+
+    def _release_speculation(self) -> None:
+        # The pool lives for one hand only, so idle tables hold no threads;
+        # requests still running finish in the background and are dropped.
+        if self._speculation_pool is None:
+            return
+        for future in self._speculating:
+            future.cancel()
+        self._speculation_pool.shutdown(wait=False)
+        self._speculation_pool = None
+        self._speculating = []
 
     def play_hand(self) -> str:
         """
         Shuffle, post blinds, deal 2 hole cards, then 4 betting rounds
         with multiple re-raises, ending in showdown if needed.
         """
+        try:
+            return self._play_hand()
+        finally:
+            self._release_speculation()
+
+    def _play_hand(self) -> str:
         self.deck = create_deck()
         random.shuffle(self.deck)
 
@@ -117,19 +111,23 @@ class PokerTable:
         for p in self.players:
             p.reset_for_new_hand()
 
-        history = f"=== NEW HAND (button at seat {self.button_position+1}) ==="
+        history: List[str] = [f"=== NEW HAND (button at seat {self.button_position+1}) ==="]
         for p in self.players:
             if p.stack <= 0:
                 p.folded = True
 
+        dealt_in = [p for p in self.players if p.stack > 0]
+        starting_stacks = {p.name: p.stack for p in dealt_in}
+        self._emit("hand_start", players=dealt_in, big_blind=self.big_blind)
+
         # Deal hole cards
         for p in self.players:
             if p.stack > 0:
                 p.hole_cards = deal(self.deck, 2)
-                history += f"\n{p.name} hole cards: {p.hole_cards}"
+                history.append(f"{p.name} hole cards: {format_cards(p.hole_cards)}")
 
         pot = 0
-        community_cards: List[str] = []
+        community_cards: List[int] = []
 
         # Post blinds
         def seat_idx(offset):
@@ -146,16 +144,16 @@ class PokerTable:
 
         sb_player.stack -= sb_amt
         pot += sb_amt
-        history += f"\n{sb_player.name} posts SB {sb_amt}."
+        history.append(f"{sb_player.name} posts SB {sb_amt}.")
 
         bb_player.stack -= bb_amt
         pot += bb_amt
-        history += f"\n{bb_player.name} posts BB {bb_amt}."
+        history.append(f"{bb_player.name} posts BB {bb_amt}.")
 
         call_amount = bb_amt
 
         def run_betting_round(stage_name: str):
-            nonlocal pot, call_amount, history
+            nonlocal pot, call_amount
 
             # Gather active seats in standard seat order (start from sb->bb->etc).
             # We'll define a circular list starting from the first to act (i.e., seat after big blind).
@@ -179,6 +177,17 @@ class PokerTable:
             current_highest_bet = call_amount
             players_acted_since_raise = 0
             idx = 0
+            speculative = None  # (seat, assumed inputs, future)
+
+            def decision_inputs(seat: int, pot_now: int, to_call: int, assumed_line: Optional[str] = None) -> Dict:
+                lines = history if assumed_line is None else history + [assumed_line]
+                return dict(
+                    community_cards=format_cards(community_cards),
+                    pot=pot_now,
+                    call_amount=to_call,
+                    min_raise=self.min_raise,
+                    game_history="\n".join(lines) + f"\n(betting round: {stage_name}, seat={seat+1})",
+                )
 
             while True:
                 # If only 1 seat remains, break
@@ -196,21 +205,64 @@ class PokerTable:
                         break
                     continue
 
-                # prompt LLM for action
-                game_state = history + f"\n(betting round: {stage_name}, seat={seat+1})"
-                action_info = ply.request_action(
-                    community_cards=community_cards,
-                    pot=pot,
-                    call_amount=current_highest_bet,
-                    min_raise=self.min_raise,
-                    game_history=game_state
-                )
+                # prompt LLM for action, reusing a prefetched answer if its
+                # assumed inputs turned out to be exactly the real ones
+                inputs = decision_inputs(seat, pot, current_highest_bet)
+                action_info = None
+                if speculative is not None:
+                    spec_seat, assumed, future = speculative
+                    speculative = None
+                    if spec_seat == seat and assumed == inputs:
+                        self.speculation_hits += 1
+                        action_info = future.result()
+                    else:
+                        self.speculation_misses += 1
+                        future.cancel()
+
+                # prefetch the next actor assuming this player calls and the
+                # round continues
+                if (
+                    self.speculate
+                    and ply.stack >= current_highest_bet
+                    and players_acted_since_raise + 1 < len(active_seats)
+                ):
+                    next_seat = active_seats[(idx + 1) % len(active_seats)]
+                    nxt = self.players[next_seat]
+                    if (
+                        nxt.supports_speculation and not nxt.folded and nxt.stack > 0
+                        and not self._speculation_busy()
+                    ):
+                        assumed = decision_inputs(
+                            next_seat,
+                            pot + current_highest_bet,
+                            current_highest_bet,
+                            assumed_line=f"{ply.name} calls {current_highest_bet}.",
+                        )
+                        future = self._speculate(nxt, assumed)
+                        speculative = (next_seat, assumed, future)
+
+                if action_info is None:
+                    action_info = ply.request_action(**inputs)
                 act = action_info["action"]
                 ramt = action_info["raise_amount"]
+                # inputs of this decision, attached to its "action" event
+                decision = dict(
+                    requested=act,
+                    pot_before=pot,
+                    # seats still contesting the pot, not ones busted earlier
+                    opponents=sum(
+                        1 for s in active_seats
+                        if s != seat and not self.players[s].folded and self.players[s].stack > 0
+                    ),
+                    community_cards=list(community_cards),
+                    min_raise=self.min_raise,
+                )
 
                 if act == "fold":
                     ply.folded = True
-                    history += f"\n{ply.name} folds."
+                    history.append(f"{ply.name} folds.")
+                    self._emit("action", player=ply, stage=stage_name, action="fold",
+                               amount=0, pot=pot, call_amount=current_highest_bet, **decision)
                     active_seats.remove(seat)
                     if len(active_seats) < 2:
                         break
@@ -224,7 +276,9 @@ class PokerTable:
                     if ply.stack < diff:
                         # can't match => fold
                         ply.folded = True
-                        history += f"\n{ply.name} tries calling {diff} but lacks chips => folds."
+                        history.append(f"{ply.name} tries calling {diff} but lacks chips => folds.")
+                        self._emit("action", player=ply, stage=stage_name, action="fold",
+                                   amount=0, pot=pot, call_amount=current_highest_bet, **decision)
                         active_seats.remove(seat)
                         if len(active_seats) < 2:
                             break
@@ -234,7 +288,9 @@ class PokerTable:
                     else:
                         ply.stack -= diff
                         pot += diff
-                        history += f"\n{ply.name} calls {diff}."
+                        history.append(f"{ply.name} calls {diff}.")
+                        self._emit("action", player=ply, stage=stage_name, action="call",
+                                   amount=diff, pot=pot, call_amount=current_highest_bet, **decision)
                         players_acted_since_raise += 1
 
                 elif act == "raise":
@@ -246,7 +302,9 @@ class PokerTable:
                     if desired_total > ply.stack:
                         # can't afford that raise => fold
                         ply.folded = True
-                        history += f"\n{ply.name} tries raising to {desired_total} but lacks chips => folds."
+                        history.append(f"{ply.name} tries raising to {desired_total} but lacks chips => folds.")
+                        self._emit("action", player=ply, stage=stage_name, action="fold",
+                                   amount=0, pot=pot, call_amount=current_highest_bet, **decision)
                         active_seats.remove(seat)
                         if len(active_seats) < 2:
                             break
@@ -257,8 +315,10 @@ class PokerTable:
                         # Must pay desired_total
                         ply.stack -= desired_total
                         pot += desired_total
+                        self._emit("action", player=ply, stage=stage_name, action="raise",
+                                   amount=desired_total, pot=pot, call_amount=current_highest_bet, **decision)
                         current_highest_bet = desired_total
-                        history += f"\n{ply.name} raises total to {desired_total}."
+                        history.append(f"{ply.name} raises total to {desired_total}.")
                         players_acted_since_raise = 0  # reset because new raise
 
                 # move to next seat
@@ -268,6 +328,10 @@ class PokerTable:
                 if players_acted_since_raise >= len(active_seats):
                     break
 
+            if speculative is not None:
+                self.speculation_misses += 1
+                speculative[2].cancel()
+
         # ********** PRE-FLOP **********
         run_betting_round("preflop")
         active = [p for p in self.players if not p.folded and p.stack > 0]
@@ -276,7 +340,7 @@ class PokerTable:
         if len(active) > 1:
             flop_cards = deal(self.deck, 3)
             community_cards.extend(flop_cards)
-            history += f"\nFLOP: {flop_cards}"
+            history.append(f"FLOP: {format_cards(flop_cards)}")
             run_betting_round("flop")
             active = [p for p in active if not p.folded and p.stack > 0]
 
@@ -284,7 +348,7 @@ class PokerTable:
         if len(active) > 1:
             turn_card = deal(self.deck, 1)
             community_cards.extend(turn_card)
-            history += f"\nTURN: {turn_card}"
+            history.append(f"TURN: {format_cards(turn_card)}")
             run_betting_round("turn")
             active = [p for p in active if not p.folded and p.stack > 0]
 
@@ -292,7 +356,7 @@ class PokerTable:
         if len(active) > 1:
             river_card = deal(self.deck, 1)
             community_cards.extend(river_card)
-            history += f"\nRIVER: {river_card}"
+            history.append(f"RIVER: {format_cards(river_card)}")
             run_betting_round("river")
             active = [p for p in active if not p.folded and p.stack > 0]
 
@@ -301,39 +365,48 @@ class PokerTable:
         if len(active) == 1:
             winner = active[0]
             winner.stack += pot
-            history += f"\nOnly {winner.name} remains, wins pot of {pot}."
+            history.append(f"Only {winner.name} remains, wins pot of {pot}.")
             pot = 0
         elif len(active) == 0:
-            history += "\nAll folded => pot unclaimed."
+            history.append("All folded => pot unclaimed.")
         else:
             # multiple remain => showdown
             best_val = None
             winners = []
             for p in active:
                 combined = p.hole_cards + community_cards
-                history += f"\nAt showdown, {p.name} hole cards: {p.hole_cards}"
+                history.append(f"At showdown, {p.name} hole cards: {format_cards(p.hole_cards)}")
                 val = score_best_5_of_7(combined)
                 if best_val is None or val > best_val:
                     best_val = val
                     winners = [p]
                 elif val == best_val:
                     winners.append(p)
+            self._emit("showdown", players=active, winners=winners)
             if len(winners) == 1:
                 w = winners[0]
                 w.stack += pot
-                history += f"\nShowdown: {w.name} wins pot of {pot}."
+                history.append(f"Showdown: {w.name} wins pot of {pot}.")
                 pot = 0
             else:
                 share = pot // len(winners)
                 names = [ww.name for ww in winners]
                 for ww in winners:
                     ww.stack += share
-                history += f"\nShowdown tie among {names}; each gets {share}."
+                history.append(f"Showdown tie among {names}; each gets {share}.")
                 pot = 0
 
+        self._emit(
+            "hand_end",
+            net={p.name: p.stack - starting_stacks[p.name] for p in dealt_in},
+        )
+
+        # Idle tables should not hold on to the rest of the deck
+        self.deck = []
+
         # Rotate dealer button
         self.button_position = (self.button_position + 1) % len(self.players)
-        return history
+        return "\n".join(history)
 
     def remove_busted(self):
         # Mark folded anyone with 0 chips
@@ -347,39 +420,179 @@ def simulate_poker_game(
     rounds: int = 5,
     elimination_count: int = 1,
     starting_stack: int = 10000,
-    human_player: bool = False
+    human_player: bool = False,
+    checkpoint_path: Optional[str] = None,
+    resume: bool = False,
+    speculate: bool = False,
+    record_path: Optional[str] = None,
 ):
     """
     1) Build LLMPlayers
     1a) If human_player=True, add a HumanPlayer
-    2) Seat them at the multi-raise PokerTable
-    3) Print each hand's log
-    4) Print final standings
+    1b) If resume=True and checkpoint_path exists, restore seats instead
+    2) Seat them at the multi-raise PokerTable (optionally prefetching decisions)
+    3) Print each hand's log, checkpointing after each hand if checkpoint_path is set
+       and appending every decision to record_path (JSON lines) if set
+    4) Print final standings and per-model stats
     """
 
-    players = []
-    for i, m_name in enumerate(model_names):
-        p = LLMPlayer(name=f"Player_{i+1}", model_id=m_name, stack=starting_stack)
-        players.append(p)
-
-    if human_player:
-        # Create a human player and insert it into the list of players at a random position
-        random_position = random.randint(0, len(players))   
-        players.insert(random_position, HumanPlayer(name="Human", stack=starting_stack))
-
-    table = PokerTable(players=players, min_raise=500, small_blind=50, big_blind=100)
+    checkpoint = load_checkpoint(checkpoint_path) if (resume and checkpoint_path) else None
+    if resume and checkpoint is None:
+        print(f"No checkpoint found at {checkpoint_path}; starting a new session.")
+    if checkpoint is not None:
+        for mismatch in resume_mismatches(checkpoint, model_names, human_player, starting_stack):
+            print(f"Warning: ignoring {mismatch}; resuming the saved session.")
 
-    for _round in range(rounds):
-        alive = sum(not pl.folded and pl.stack > 0 for pl in players)
-        if alive <= elimination_count:
-            break
-
-        hand_history = table.play_hand()
-        print(hand_history, "\n----- END HAND -----\n")
-        table.remove_busted()
+    players = []
+    if checkpoint is not None:
+        # Seating order matters for blinds, so rebuild exactly as saved.
+        for seat in checkpoint["players"]:
+            if seat["human"]:
+                players.append(HumanPlayer(name=seat["name"], stack=seat["stack"]))
+            else:
+                players.append(LLMPlayer(name=seat["name"], model_id=seat["model_id"], stack=seat["stack"]))
+    else:
+        for i, m_name in enumerate(model_names):
+            p = LLMPlayer(name=f"Player_{i+1}", model_id=m_name, stack=starting_stack)
+            players.append(p)
+
+        if human_player:
+            # Create a human player and insert it into the list of players at a random position
+            random_position = random.randint(0, len(players))
+            players.insert(random_position, HumanPlayer(name="Human", stack=starting_stack))
+
+    stats = StatsTracker()
+    listeners = [stats.handle_event]
+    recorder = DecisionRecorder(record_path) if record_path else None
+    if recorder is not None:
+        listeners.append(recorder.handle_event)
+    table = PokerTable(
+        players=players,
+        min_raise=500,
+        small_blind=50,
+        big_blind=100,
+        listeners=listeners,
+        speculate=speculate,
+    )
+
+    try:
+        start_hand = 0
+        if checkpoint is not None:
+            start_hand = checkpoint["hand_number"]
+            table.button_position = checkpoint["button_position"]
+            stats.load_state(checkpoint["stats"])
+            restore_rng(checkpoint)
+            table.remove_busted()
+            print(f"Resuming from {checkpoint_path} at hand {start_hand + 1}.")
+            starting_stack = checkpoint.get("starting_stack") or starting_stack
+
+        if checkpoint_path:
+            # Write once up front so an unwritable path fails before any paid hand.
+            save_checkpoint(checkpoint_path, capture_session(table, start_hand, stats, starting_stack))
+
+        for _round in range(start_hand, rounds):
+            alive = sum(not pl.folded and pl.stack > 0 for pl in players)
+            if alive <= elimination_count:
+                break
+
+            try:
+                hand_history = table.play_hand()
+            except Exception:
+                if checkpoint_path:
+                    print(f"Hand {_round + 1} aborted; rerun with --resume to replay it from {checkpoint_path}.")
+                raise
+            print(hand_history, "\n----- END HAND -----\n")
+            table.remove_busted()
+            if checkpoint_path:
+                save_checkpoint(checkpoint_path, capture_session(table, _round + 1, stats, starting_stack))
+    finally:
+        if recorder is not None:
+            recorder.close()
 
     # final standings
     ranking = sorted(players, key=lambda x: x.stack, reverse=True)
     print("\n=== FINAL STANDINGS ===")
     for i, ply in enumerate(ranking, start=1):
         print(f"{i}. {ply.name} ({ply.model_id}): ${ply.stack}")
+
+    snapshot = stats.snapshot()
+    if snapshot:
+        print("\n=== MODEL STATS ===")
+        print(stats.format_snapshot(snapshot))
+
+
+def simulate_poker_tables(
+    model_names: List[str],
+    tables: int = 2,
+    rounds: int = 5,
+    elimination_count: int = 1,
+    starting_stack: int = 10000,
+    batch_window: float = 0.05,
+    speculate: bool = False,
+    max_tables: int = 10000,
+    workers: int = 64,
+    memory_budget: Optional[int] = None,
+    print_hands: bool = True,
+    record_path: Optional[str] = None,
+    batch_endpoint: Optional[str] = None,
+):
+    """
+    Like simulate_poker_game, but plays many tables of the same line-up
+    concurrently on a TableHost: at most max_tables tables (or as many as
+    fit in memory_budget bytes) are held in memory, and at most `workers`
+    hands, i.e. pending decisions, run at once.
+    All LLMPlayers share one PromptBatcher, so decisions pending for the
+    same model on different tables are sent together: through the llm
+    library by default, or as one request per batch to an OpenAI-compatible
+    completions server at batch_endpoint.
+    """
+    from .host import TableHost
+
+    dispatch = completions_dispatch(batch_endpoint) if batch_endpoint else None
+    batcher = PromptBatcher(dispatch=dispatch, window=batch_window)
+    stats = StatsTracker()
+    listeners = [stats.handle_event]
+    recorder = DecisionRecorder(record_path) if record_path else None
+    if recorder is not None:
+        listeners.append(recorder.handle_event)
+
+    def make_table(t: int) -> PokerTable:
+        players = [
+            LLMPlayer(name=f"T{t+1}_Player_{i+1}", model_id=m_name, stack=starting_stack, batcher=batcher)
+            for i, m_name in enumerate(model_names)
+        ]
+        return PokerTable(
+            players=players,
+            min_raise=500,
+            small_blind=50,
+            big_blind=100,
+            listeners=listeners,
+            speculate=speculate,
+        )
+
+    def print_hand(t: int, hand_history: str) -> None:
+        if print_hands:
+            print(f"[table {t+1}]\n{hand_history}", "\n----- END HAND -----\n")
+
+    host = TableHost(make_table, max_tables=max_tables, workers=workers, memory_budget=memory_budget)
+    # Only final stacks are kept per finished table, not the table itself.
+    final_stacks: Dict[int, List[tuple]] = {}
+    try:
+        for t, table in host.run(tables, rounds, elimination_count, on_hand=print_hand):
+            final_stacks[t] = [(p.name, p.model_id, p.stack) for p in table.players]
+    finally:
+        batcher.close()
+        if recorder is not None:
+            recorder.close()
+
+    print("\n=== FINAL STANDINGS ===")
+    for t in sorted(final_stacks):
+        ranking = sorted(final_stacks[t], key=lambda x: x[2], reverse=True)
+        print(f"-- table {t+1} --")
+        for i, (name, model_id, stack) in enumerate(ranking, start=1):
+            print(f"{i}. {name} ({model_id}): ${stack}")
+
+    snapshot = stats.snapshot()
+    if snapshot:
+        print("\n=== MODEL STATS ===")
+        print(stats.format_snapshot(snapshot))
@@ -0,0 +1,237 @@
+# llm_poker/grading.py
+
+import itertools
+import json
+import os
+import random
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import click
+
+from .cards import format_cards, parse_card, score_best_5_of_7
+from .stats import model_key
+
+
+class DecisionRecorder:
+    """
+    PokerTable listener that appends one JSON line per decision with the
+    inputs request_action saw (hole cards, board, pot, call amount, min
+    raise, opponents) and the action taken, for grading after the run.
+
+    A hand's decisions are buffered per table and written on hand_end, so
+    a hand that raises (and is replayed on --resume) is never recorded.
+    """
+
+    def __init__(self, path: str):
+        self._fh = open(path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._hands: Dict[int, List[str]] = {}
+
+    def handle_event(self, event: str, payload: Dict) -> None:
+        key = id(payload["table"])
+        if event == "hand_start":
+            with self._lock:
+                self._hands[key] = []
+            return
+        if event == "hand_end":
+            with self._lock:
+                lines = self._hands.pop(key, [])
+                if lines:
+                    self._fh.write("".join(lines))
+                    self._fh.flush()
+            return
+        if event != "action":
+            return
+        player = payload["player"]
+        record = {
+            "model": model_key(player),
+            "player": player.name,
+            "stage": payload["stage"],
+            "action": payload["action"],
+            "forced": payload["requested"] != payload["action"],
+            "amount": payload["amount"],
+            "hole_cards": format_cards(player.hole_cards),
+            "community_cards": format_cards(payload["community_cards"]),
+            "pot": payload["pot_before"],
+            "call_amount": payload["call_amount"],
+            "min_raise": payload["min_raise"],
+            "opponents": payload["opponents"],
+            "big_blind": payload["table"].big_blind,
+        }
+        line = json.dumps(record, ensure_ascii=False)
+        with self._lock:
+            self._hands.setdefault(key, []).append(line + "\n")
+
+    def close(self) -> None:
+        """Close the file; decisions of a hand that never ended are dropped."""
+        with self._lock:
+            self._hands.clear()
+            self._fh.close()
+
+
+def estimate_equity(hole: List[int], board: List[int], opponents: int, samples: int, rng: random.Random) -> float:
+    """
+    Monte Carlo share of the pot won against `opponents` random hands,
+    completing the board at random. Ties count as a split.
+    """
+    if opponents <= 0:
+        return 1.0
+    known = set(hole) | set(board)
+    deck = [c for c in range(52) if c not in known]
+    need = 5 - len(board)
+    won = 0.0
+    for _ in range(samples):
+        drawn = rng.sample(deck, need + 2 * opponents)
+        full_board = board + drawn[:need]
+        mine = score_best_5_of_7(hole + full_board)
+        opp_scores = [
+            score_best_5_of_7(drawn[need + 2 * i:need + 2 * i + 2] + full_board)
+            for i in range(opponents)
+        ]
+        best = max(opp_scores)
+        if mine > best:
+            won += 1.0
+        elif mine == best:
+            won += 1.0 / (1 + opp_scores.count(best))
+    return won / samples
+
+
+def grade_decision(record: Dict, samples: int, rng: random.Random) -> Dict:
+    """
+    Annotate one decision with pot odds, equity and EV.
+
+    Putting in `cost` chips is valued as equity * (pot + cost) - cost, i.e.
+    pot odds with no fold equity or future betting; folding is worth 0. A
+    decision is +EV when neither folding nor calling was worth more, and its
+    EV loss is the chips given up against the best of those two. So a raise
+    that does worse than a plain call is -EV even when it beats folding.
+    """
+    hole = [parse_card(c) for c in record["hole_cards"]]
+    board = [parse_card(c) for c in record["community_cards"]]
+    equity = estimate_equity(hole, board, record["opponents"], samples, rng)
+
+    pot = record["pot"]
+    call = record["call_amount"]
+    cost = record["amount"] if record["action"] == "raise" else call
+    pot_odds = cost / (pot + cost) if (pot + cost) else 0.0
+
+    ev_call = equity * (pot + call) - call
+    best_alternative = max(0.0, ev_call)
+    if record["action"] == "fold":
+        ev_loss = best_alternative
+    elif record["action"] == "raise":
+        ev_loss = max(0.0, best_alternative - (equity * (pot + cost) - cost))
+    else:
+        ev_loss = max(0.0, -ev_call)
+
+    return {
+        "model": record["model"],
+        "stage": record["stage"],
+        "action": record["action"],
+        "equity": equity,
+        "pot_odds": pot_odds,
+        "plus_ev": ev_loss == 0.0,
+        "ev_loss": ev_loss,
+        "ev_loss_bb": ev_loss / (record.get("big_blind") or 1),
+    }
+
+
+def grade_batch(batch: List[Tuple[int, Dict]], samples: int, seed: int) -> List[Dict]:
+    """Grade a batch in a worker; each decision gets its own seeded RNG."""
+    return [grade_decision(record, samples, random.Random(seed + index)) for index, record in batch]
+
+
+def read_decisions(path: str) -> Iterator[Dict]:
+    """Stream recorded decisions, skipping forced folds (not a real choice)."""
+    with open(path, "r", encoding="utf-8") as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            if not record.get("forced"):
+                yield record
+
+
+def grade_decisions(
+    records: Iterable[Dict],
+    samples: int = 200,
+    batch_size: int = 32,
+    workers: Optional[int] = None,
+    seed: int = 0,
+) -> Iterator[Dict]:
+    """
+    Grade decisions in batches across a process pool, streaming results.
+    At most 2 * workers batches are held in memory at once. workers=1
+    grades in-process.
+    """
+    indexed = enumerate(records)
+    batches = iter(lambda: list(itertools.islice(indexed, batch_size)), [])
+
+    if workers == 1:
+        for batch in batches:
+            yield from grade_batch(batch, samples, seed)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        limit = 2 * workers
+        in_flight = []
+        for batch in batches:
+            in_flight.append(pool.submit(grade_batch, batch, samples, seed))
+            if len(in_flight) >= limit:
+                yield from in_flight.pop(0).result()
+        for future in in_flight:
+            yield from future.result()
+
+
+def summarize(grades: Iterable[Dict]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Aggregate graded decisions per model and street (plus an "all" row)."""
+    summary: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for g in grades:
+        streets = summary.setdefault(g["model"], {})
+        for street in (g["stage"], "all"):
+            row = streets.setdefault(street, {"decisions": 0, "plus_ev": 0, "ev_loss": 0.0, "ev_loss_bb": 0.0})
+            row["decisions"] += 1
+            row["plus_ev"] += int(g["plus_ev"])
+            row["ev_loss"] += g["ev_loss"]
+            row["ev_loss_bb"] += g["ev_loss_bb"]
+    return summary
+
+
+def format_summary(summary: Dict[str, Dict[str, Dict[str, float]]]) -> str:
+    lines: List[str] = []
+    order = ["preflop", "flop", "turn", "river", "all"]
+    for model in sorted(summary):
+        lines.append(f"{model}:")
+        streets = summary[model]
+        for street in sorted(streets, key=lambda s: order.index(s) if s in order else len(order)):
+            row = streets[street]
+            n = row["decisions"]
+            lines.append(
+                f"  {street:<8} decisions {n:>6} | +EV {row['plus_ev'] / n:.0%} | "
+                f"EV loss {row['ev_loss']:.0f} chips ({row['ev_loss_bb'] / n:.2f} bb/decision)"
+            )
+    return "\n".join(lines)
+
+
+@click.command()
+@click.argument("records", type=click.Path(exists=True, dir_okay=False))
+@click.option("--samples", default=200, help="Monte Carlo samples per decision.")
+@click.option("--batch-size", default=32, help="Decisions per worker batch.")
+@click.option("--workers", "-w", default=None, type=int, help="Worker processes (default: CPU count).")
+@click.option("--seed", default=0, help="Base RNG seed, for reproducible grades.")
+def main(records, samples, batch_size, workers, seed):
+    """
+    Grade decisions recorded with `llm_poker --record` by pot odds and equity.
+    Example:
+      llm_poker_grade decisions.jsonl --samples 500
+    """
+    grades = grade_decisions(read_decisions(records), samples=samples, batch_size=batch_size, workers=workers, seed=seed)
+    print(format_summary(summarize(grades)))
+
+
+if __name__ == "__main__":
+    main()
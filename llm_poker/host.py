@@ -0,0 +1,139 @@
+# llm_poker/host.py
+
+import queue
+import sys
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .environment import PokerTable
+
+
+def table_footprint(table: PokerTable) -> int:
+    """
+    Rough resident size in bytes of one idle table: the table, its seats and
+    their per-seat containers. Models, loggers and batchers are shared across
+    tables and therefore not counted.
+    """
+    size = sys.getsizeof(table) + sys.getsizeof(table.players) + sys.getsizeof(table.listeners)
+    for p in table.players:
+        size += sys.getsizeof(p) + sys.getsizeof(p.name) + sys.getsizeof(p.hole_cards)
+    return size
+
+
+class TableHost:
+    """
+    Plays many tables in one process within a fixed budget.
+
+    Tables are created lazily by table_factory(table_id) and admitted while
+    fewer than max_tables are held in memory (further capped by
+    memory_budget bytes, if given, using the footprint of the first table).
+    Each admitted table has exactly one hand queued or running; `workers`
+    threads play hands, so at most `workers` hands (and therefore at most
+    `workers` player decisions, plus any speculative prefetches) are
+    pending at once. When a table finishes its hands it is released and the
+    next one admitted. If a hand raises, or the caller stops iterating, no
+    further hand is started and only those already running are awaited.
+    """
+
+    def __init__(
+        self,
+        table_factory: Callable[[int], PokerTable],
+        max_tables: int = 10000,
+        workers: int = 64,
+        memory_budget: Optional[int] = None,
+    ):
+        self.table_factory = table_factory
+        self.max_tables = max_tables
+        self.workers = workers
+        self.memory_budget = memory_budget
+
+    def _capacity(self, sample: PokerTable) -> int:
+        if self.memory_budget is None:
+            return self.max_tables
+        return max(1, min(self.max_tables, self.memory_budget // table_footprint(sample)))
+
+    def run(
+        self,
+        total_tables: int,
+        hands_per_table: int,
+        elimination_count: int = 1,
+        on_hand: Optional[Callable[[int, str], None]] = None,
+        stop: Optional[threading.Event] = None,
+    ) -> Iterator[Tuple[int, PokerTable]]:
+        """
+        Play hands_per_table hands (or until elimination_count players
+        remain) at each of total_tables tables, yielding (table_id, table)
+        as tables finish. on_hand(table_id, history) is called per hand;
+        histories are not retained by the host.
+
+        `stop` is set by the worker whose hand raises, before it picks up
+        another hand; queued hands check it and are skipped, and the first
+        error is re-raised here. The caller may also set it (e.g. on
+        shutdown) to end play between hands; run then returns once the
+        running hands finish, and errors they raise after the stop are not
+        re-raised.
+        """
+        if total_tables <= 0:
+            return
+        # Completed hands are pushed here by done-callbacks, so waiting costs
+        # O(1) regardless of how many tables are in flight.
+        completed: "queue.Queue[Future]" = queue.Queue()
+        in_flight: Dict[Future, Tuple[int, PokerTable, int]] = {}
+        stop = stop if stop is not None else threading.Event()
+        errors: List[BaseException] = []
+
+        def play(table: PokerTable) -> str:
+            if stop.is_set():
+                raise CancelledError()
+            try:
+                return table.play_hand()
+            except BaseException as e:
+                if not stop.is_set():
+                    errors.append(e)
+                    stop.set()
+                raise
+
+        pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="table")
+        try:
+
+            def admit(table_id: int, table: PokerTable, hands_played: int) -> bool:
+                alive = sum(not p.folded and p.stack > 0 for p in table.players)
+                if hands_played >= hands_per_table or alive <= elimination_count:
+                    return False
+                future = pool.submit(play, table)
+                in_flight[future] = (table_id, table, hands_played)
+                future.add_done_callback(completed.put)
+                return True
+
+            sample: Optional[PokerTable] = self.table_factory(0)
+            capacity = self._capacity(sample)
+            next_id = 0
+
+            while (next_id < total_tables or in_flight) and not stop.is_set():
+                while next_id < total_tables and len(in_flight) < capacity and not stop.is_set():
+                    table = sample if sample is not None else self.table_factory(next_id)
+                    sample = None
+                    if not admit(next_id, table, 0):
+                        yield next_id, table
+                    next_id += 1
+                if not in_flight:
+                    continue
+
+                future = completed.get()
+                if stop.is_set():
+                    break
+                table_id, table, hands_played = in_flight.pop(future)
+                history = future.result()
+                table.remove_busted()
+                if on_hand is not None:
+                    on_hand(table_id, history)
+                if not admit(table_id, table, hands_played + 1):
+                    yield table_id, table
+            if errors:
+                raise errors[0]
+        finally:
+            # Not shutdown(cancel_futures=True): that needs Python 3.9+.
+            for future in in_flight:
+                future.cancel()
+            pool.shutdown(wait=True)
@@ -1,11 +1,13 @@
 from typing import Dict, List
 from .player import Player
+from .cards import format_cards
 
 class HumanPlayer(Player):
     """
     A human player implementation that interacts through the command line.
     Inherits from the Player base class and implements interactive decision making.
     """
+    __slots__ = ("model_id",)
 
     def __init__(self, name: str, stack: int = 10000):
         """
@@ -41,7 +43,7 @@ class HumanPlayer(Player):
         """
         # Display current game state
         print("\n=== Your Turn ===")
-        print(f"Your hole cards: {self.hole_cards}")
+        print(f"Your hole cards: {format_cards(self.hole_cards)}")
         print(f"Community cards: {community_cards}")
         print(f"Current pot: {pot}")
         print(f"Amount to call: {call_amount}")
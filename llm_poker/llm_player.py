@@ -1,10 +1,13 @@
 # llm_player.py
 
 import json
+import logging
 from typing import List, Dict, Optional, Type
 import llm
 from pydantic import BaseModel, ValidationError, Field
 from .player import Player
+from .batching import PromptBatcher
+from .cards import format_cards
 
 class ActionSchema(BaseModel):
     action: str = Field(..., pattern="^(fold|call|raise)$")
@@ -31,13 +34,29 @@ def parse_llm_json(raw_text: str, model_class: Type[BaseModel]) -> BaseModel:
     data = json.loads(snippet)
     return model_class(**data)
 
+def model_logger(model_id: str) -> logging.Logger:
+    """One logger per model, shared by every seat playing that model."""
+    logger = logging.getLogger(f"llm_poker.model.{model_id}")
+    logger.setLevel(logging.INFO)
+    return logger
+
 #######################################################################
 
 class LLMPlayer(Player):
     """
     A poker player implementation that uses an LLM to make decisions.
     """
-    def __init__(self, name: str, model_id: str, stack: int = 10000):
+    __slots__ = ("model_id", "_batcher", "_model")
+
+    supports_speculation = True
+
+    def __init__(
+        self,
+        name: str,
+        model_id: str,
+        stack: int = 10000,
+        batcher: Optional[PromptBatcher] = None,
+    ):
         """
         Initialize an LLM-based poker player.
 
@@ -45,10 +64,14 @@ class LLMPlayer(Player):
             name (str): The player's name
             model_id (str): ID of the LLM model to use
             stack (int, optional): Initial chip stack. Defaults to 10000.
+            batcher (PromptBatcher, optional): Shared batcher to send prompts
+                through instead of prompting the model directly.
         """
         super().__init__(name, stack)
         self.model_id = model_id
-        self._model = llm.get_model(model_id)
+        self._batcher = batcher
+        self._model = llm.get_model(model_id) if batcher is None else None
+        self.logger = model_logger(model_id)
 
     def request_action(
         self,
@@ -82,7 +105,7 @@ Here's the current game state:
 Game history: {game_history}
 You are {self.name} with {self.stack} chips.
 
-Hole cards: {self.hole_cards}
+Hole cards: {format_cards(self.hole_cards)}
 Community cards: {community_cards}
 Pot: {pot}
 Amount to call: {call_amount}
@@ -125,15 +148,18 @@ Output VALID JSON ONLY, e.g.:
         """
 
         for attempt in range(5): # Should be while True: but changed to not have infinite loops.
-            resp = self._model.prompt(prompt_text)
-            raw_text = resp.text().strip()
-            self.logger.debug(f"Raw LLM action output (attempt {attempt+1}): {raw_text!r}")
+            if self._batcher is not None:
+                raw_text = self._batcher.prompt(self.model_id, prompt_text).strip()
+            else:
+                resp = self._model.prompt(prompt_text)
+                raw_text = resp.text().strip()
+            self.logger.debug(f"{self.name}: raw LLM action output (attempt {attempt+1}): {raw_text!r}")
 
             try:
                 data = parse_llm_json(raw_text, ActionSchema)
                 # data is a validated ActionSchema object
                 return data.dict()  # or just return data if you prefer
             except (ValueError, ValidationError) as e:
-                self.logger.warning(f"Parsing/validation error on attempt {attempt+1}: {e}")
+                self.logger.warning(f"{self.name}: parsing/validation error on attempt {attempt+1}: {e}")
 
         raise RuntimeError(f"{self.name} gave too many invalid responses for request_action")
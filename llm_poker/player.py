@@ -2,11 +2,21 @@ import logging
 from abc import ABC, abstractmethod
 from typing import List, Dict
 
+_PLAYER_LOGGER = logging.getLogger("llm_poker.player")
+_PLAYER_LOGGER.setLevel(logging.INFO)
+
 class Player(ABC):
     """
     Abstract base class defining the interface for poker players.
     All concrete player implementations must inherit from this class.
     """
+
+    __slots__ = ("name", "stack", "hole_cards", "folded", "logger")
+
+    # Whether the table may call request_action early, on a worker thread,
+    # with a guessed game state whose result might be thrown away.
+    supports_speculation = False
+
     def __init__(self, name: str, stack: int = 10000):
         """
         Initialize a new player.
@@ -17,10 +27,10 @@ class Player(ABC):
         """
         self.name = name
         self.stack = stack
-        self.hole_cards: List[str] = []
+        self.hole_cards: List[int] = []
         self.folded = False
-        self.logger = logging.getLogger(self.name)
-        self.logger.setLevel(logging.INFO)
+        # Loggers are shared (per model in subclasses), not created per seat.
+        self.logger = _PLAYER_LOGGER
 
     def reset_for_new_hand(self) -> None:
         """Reset player state for a new hand."""
@@ -0,0 +1,137 @@
+import queue
+import threading
+from typing import Dict, List, Optional
+from .player import Player
+from .cards import format_cards
+
+VALID_ACTIONS = ("fold", "call", "raise")
+
+
+class RemotePlayer(Player):
+    """
+    A seat whose decisions are submitted from outside the table thread,
+    e.g. by a human or external bot over the table server.
+
+    request_action publishes the decision state and waits up to
+    action_timeout seconds for submit_action; if nothing valid arrives in
+    time the seat auto-folds, so one slow client cannot stall the table.
+    close() fails the pending decision and any later one, so a stopping
+    server does not wait out the timeout.
+    """
+    __slots__ = ("model_id", "action_timeout", "_lock", "_pending", "_decision_id", "_actions", "_closed")
+
+    def __init__(self, name: str, stack: int = 10000, action_timeout: float = 30.0):
+        """
+        Initialize a remote seat.
+
+        Args:
+            name (str): The player's name
+            stack (int, optional): Initial chip stack. Defaults to 10000.
+            action_timeout (float, optional): Seconds to wait for an action
+                before auto-folding. Defaults to 30.
+        """
+        super().__init__(name, stack)
+        self.model_id: str = "Remote"
+        self.action_timeout = action_timeout
+        self._lock = threading.Lock()
+        self._pending: Optional[Dict] = None
+        self._decision_id = 0
+        # None is the wake-up sent by close()
+        self._actions: "queue.Queue[Optional[Dict]]" = queue.Queue()
+        self._closed = False
+
+    def _redact(self, game_history: str) -> str:
+        # The table history lists every seat's hole cards; a remote client
+        # only gets its own.
+        return "\n".join(
+            line for line in game_history.split("\n")
+            if " hole cards: " not in line
+            or line.startswith(f"{self.name} hole cards: ")
+            or line.startswith("At showdown, ")
+        )
+
+    def pending_decision(self) -> Optional[Dict]:
+        """The decision this seat is currently being asked for, if any."""
+        with self._lock:
+            return dict(self._pending) if self._pending is not None else None
+
+    def submit_action(self, decision_id: int, action: str, raise_amount: Optional[int] = None) -> bool:
+        """
+        Answer the pending decision. Returns False if decision_id is not the
+        one currently pending (stale or early submissions are ignored).
+
+        Raises:
+            ValueError: If the action is not fold/call/raise
+        """
+        if action not in VALID_ACTIONS:
+            raise ValueError(f"Invalid action {action!r}; expected one of {VALID_ACTIONS}")
+        if raise_amount is not None:
+            raise_amount = int(raise_amount)
+        with self._lock:
+            if self._pending is None or self._pending["decision_id"] != decision_id:
+                return False
+            self._pending = None
+            self._actions.put({"action": action, "raise_amount": raise_amount})
+        return True
+
+    def close(self) -> None:
+        """Stop accepting actions and wake a request_action that is waiting."""
+        with self._lock:
+            self._closed = True
+            self._pending = None
+            self._actions.put(None)
+
+    def request_action(
+        self,
+        community_cards: List[str],
+        pot: int,
+        call_amount: int,
+        min_raise: int,
+        game_history: str
+    ) -> Dict:
+        """
+        Publish the game state for the remote client and block this table's
+        thread until it answers or action_timeout expires.
+
+        Args:
+            community_cards (List[str]): List of community cards
+            pot (int): Current pot size
+            call_amount (int): Amount needed to call
+            min_raise (int): Minimum raise amount
+            game_history (str): String representation of the game history
+
+        Returns:
+            Dict: Action dictionary with keys 'action' and 'raise_amount'
+
+        Raises:
+            RuntimeError: If the seat is closed before or while waiting
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.name}: remote seat is closed")
+            self._decision_id += 1
+            self._pending = {
+                "decision_id": self._decision_id,
+                "hole_cards": format_cards(self.hole_cards),
+                "community_cards": list(community_cards),
+                "pot": pot,
+                "call_amount": call_amount,
+                "min_raise": min_raise,
+                "stack": self.stack,
+                "game_history": self._redact(game_history),
+            }
+        try:
+            action = self._actions.get(timeout=self.action_timeout)
+        except queue.Empty:
+            with self._lock:
+                if self._pending is None:
+                    # An action was accepted, or the seat closed, just as the
+                    # wait timed out.
+                    action = self._actions.get_nowait()
+                else:
+                    self._pending = None
+                    self.logger.warning(f"{self.name}: no action within {self.action_timeout}s, auto-folding")
+                    return {"action": "fold", "raise_amount": None}
+        if action is None:
+            raise RuntimeError(f"{self.name}: remote seat is closed")
+        return action
@@ -0,0 +1,286 @@
+# llm_poker/server.py
+
+import asyncio
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+from .batching import PromptBatcher, completions_dispatch
+from .environment import PokerTable
+from .host import TableHost
+from .llm_player import LLMPlayer
+from .remote_player import RemotePlayer
+
+HOST = "127.0.0.1"
+MAX_BODY_BYTES = 64 * 1024
+MAX_LONG_POLL = 30.0
+
+
+class TableServer:
+    """
+    Hosts many tables on a TableHost and exposes their RemotePlayer seats
+    over a small JSON HTTP API on localhost:
+
+      GET  /tables                                  list tables and seats
+      GET  /tables/<id>/seats/<name>?wait=<secs>    pending decision (long-poll)
+      POST /tables/<id>/seats/<name>/action         {"decision_id", "action", "raise_amount"}
+
+    Table play runs on worker threads; the asyncio loop only serves HTTP,
+    so a seat waiting on a client never blocks other tables or LLM seats.
+    Cancelling serve() (e.g. Ctrl-C) stops play after the running hands.
+    """
+
+    def __init__(
+        self,
+        model_names: List[str],
+        remote_seats: int = 1,
+        tables: int = 1,
+        rounds: int = 10,
+        elimination_count: int = 1,
+        starting_stack: int = 10000,
+        action_timeout: float = 30.0,
+        batch_window: float = 0.05,
+        port: int = 8765,
+        batch_endpoint: Optional[str] = None,
+    ):
+        self.model_names = model_names
+        self.remote_seats = remote_seats
+        self.tables = tables
+        self.rounds = rounds
+        self.elimination_count = elimination_count
+        self.starting_stack = starting_stack
+        self.action_timeout = action_timeout
+        self.port = port
+        dispatch = completions_dispatch(batch_endpoint) if batch_endpoint else None
+        self.batcher = PromptBatcher(dispatch=dispatch, window=batch_window) if model_names else None
+        self._tables: Dict[int, PokerTable] = {}
+        self._hands_played: Dict[int, int] = {}
+        self._finished: set = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    # ---- table hosting (worker threads) ----
+
+    def _make_table(self, t: int) -> PokerTable:
+        players = [
+            LLMPlayer(name=f"T{t+1}_Player_{i+1}", model_id=m_name, stack=self.starting_stack, batcher=self.batcher)
+            for i, m_name in enumerate(self.model_names)
+        ]
+        for i in range(self.remote_seats):
+            players.append(RemotePlayer(
+                name=f"T{t+1}_Remote_{i+1}", stack=self.starting_stack, action_timeout=self.action_timeout,
+            ))
+        table = PokerTable(players=players, min_raise=500, small_blind=50, big_blind=100)
+        with self._lock:
+            self._tables[t] = table
+            self._hands_played[t] = 0
+        if self._stop.is_set():
+            # Created while stop() ran; it may have missed these seats.
+            for p in players:
+                if isinstance(p, RemotePlayer):
+                    p.close()
+        return table
+
+    def stop(self) -> None:
+        """
+        End play: no new hands are started, and remote seats waiting on a
+        client fail their decision so their hands end now.
+        """
+        self._stop.set()
+        with self._lock:
+            tables = list(self._tables.values())
+        for table in tables:
+            for p in table.players:
+                if isinstance(p, RemotePlayer):
+                    p.close()
+
+    def _on_hand(self, t: int, hand_history: str) -> None:
+        with self._lock:
+            self._hands_played[t] += 1
+        print(f"[table {t+1}]\n{hand_history}", "\n----- END HAND -----\n")
+
+    def play_all(self) -> None:
+        """Blocking: play every table to completion."""
+        host = TableHost(self._make_table, max_tables=self.tables, workers=max(1, self.tables))
+        try:
+            results = host.run(self.tables, self.rounds, self.elimination_count,
+                               on_hand=self._on_hand, stop=self._stop)
+            for t, _table in results:
+                with self._lock:
+                    self._finished.add(t)
+        finally:
+            if self.batcher is not None:
+                self.batcher.close()
+
+    # ---- HTTP API (event loop) ----
+
+    def _find_seat(self, table_id: int, name: str) -> Optional[RemotePlayer]:
+        with self._lock:
+            table = self._tables.get(table_id)
+        if table is None:
+            return None
+        for p in table.players:
+            if p.name == name and isinstance(p, RemotePlayer):
+                return p
+        return None
+
+    def list_tables(self) -> List[Dict]:
+        with self._lock:
+            items = sorted(self._tables.items())
+            hands = dict(self._hands_played)
+            finished = set(self._finished)
+        return [
+            {
+                "id": t,
+                "hands_played": hands.get(t, 0),
+                "finished": t in finished,
+                "seats": [
+                    {
+                        "name": p.name,
+                        "model_id": p.model_id,
+                        "stack": p.stack,
+                        "remote": isinstance(p, RemotePlayer),
+                    }
+                    for p in table.players
+                ],
+            }
+            for t, table in items
+        ]
+
+    async def _route(self, method: str, path: str, query: Dict[str, str], body: bytes) -> Tuple[int, object]:
+        parts = [p for p in path.split("/") if p]
+        if method == "GET" and parts == ["tables"]:
+            return 200, self.list_tables()
+
+        if len(parts) < 4 or parts[0] != "tables" or parts[2] != "seats":
+            return 404, {"error": "not found"}
+        try:
+            table_id = int(parts[1])
+        except ValueError:
+            return 404, {"error": "not found"}
+        seat = self._find_seat(table_id, parts[3])
+        if seat is None:
+            return 404, {"error": "no such remote seat"}
+
+        if method == "GET" and len(parts) == 4:
+            try:
+                wait = min(float(query.get("wait", 0)), MAX_LONG_POLL)
+            except ValueError:
+                return 400, {"error": "wait must be a number"}
+            deadline = time.monotonic() + wait
+            pending = seat.pending_decision()
+            while pending is None and time.monotonic() < deadline:
+                await asyncio.sleep(0.05)
+                pending = seat.pending_decision()
+            return 200, {"pending": pending, "stack": seat.stack}
+
+        if method == "POST" and len(parts) == 5 and parts[4] == "action":
+            try:
+                data = json.loads(body or b"{}")
+                accepted = seat.submit_action(
+                    int(data["decision_id"]), data["action"], data.get("raise_amount"),
+                )
+            except (ValueError, KeyError, TypeError) as e:
+                return 400, {"error": str(e)}
+            if not accepted:
+                return 409, {"error": "decision is no longer pending"}
+            return 200, {"accepted": True}
+
+        return 405, {"error": "method not allowed"}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        status, payload = 400, {"error": "bad request"}
+        try:
+            request_line = (await reader.readline()).decode("latin-1").strip()
+            method, target, _version = request_line.split(" ", 2)
+            headers: Dict[str, str] = {}
+            while True:
+                line = (await reader.readline()).decode("latin-1").strip()
+                if not line:
+                    break
+                key, _, value = line.partition(":")
+                headers[key.strip().lower()] = value.strip()
+            length = int(headers.get("content-length", 0))
+            if length > MAX_BODY_BYTES:
+                status, payload = 413, {"error": "body too large"}
+            else:
+                body = await reader.readexactly(length) if length else b""
+                path, _, qs = target.partition("?")
+                query = dict(kv.partition("=")[::2] for kv in qs.split("&") if kv)
+                status, payload = await self._route(method.upper(), path, query, body)
+        except (ValueError, asyncio.IncompleteReadError):
+            pass
+        data = json.dumps(payload).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            f"Connection: close\r\n\r\n".encode("latin-1") + data
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self) -> None:
+        """Serve the API on localhost while all tables are played."""
+        server = await asyncio.start_server(self._handle, HOST, self.port)
+        self.port = server.sockets[0].getsockname()[1]
+        print(f"Table server listening on http://{HOST}:{self.port}")
+        async with server:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.play_all)
+            except asyncio.CancelledError:
+                # The executor thread cannot be cancelled; make it return so
+                # shutdown does not wait for (or pay for) every remaining hand.
+                self.stop()
+                raise
+        print("\n=== FINAL STANDINGS ===")
+        for table in self.list_tables():
+            print(f"-- table {table['id']+1} --")
+            ranking = sorted(table["seats"], key=lambda s: s["stack"], reverse=True)
+            for i, seat in enumerate(ranking, start=1):
+                print(f"{i}. {seat['name']} ({seat['model_id']}): ${seat['stack']}")
+
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            409: "Conflict", 413: "Payload Too Large"}
+
+
+@click.command()
+@click.option("--models", "-m", default="gpt-5", help="Space-separated model names for LLM seats.")
+@click.option("--remote-seats", default=1, help="Remote seats per table for humans or external bots.")
+@click.option("--tables", "-t", default=1, help="Number of tables to host.")
+@click.option("--rounds", "-r", default=10, help="Number of hands per table.")
+@click.option("--elimination-count", "-e", default=1, help="Stop a table when only this many players remain.")
+@click.option("--stack", "-s", default=10000, help="Starting stack for each player.")
+@click.option("--port", "-p", default=8765, help="Port to listen on (always bound to 127.0.0.1).")
+@click.option("--action-timeout", default=30.0, help="Seconds a remote seat has to act before auto-folding.")
+@click.option("--batch-window", default=0.05, help="Seconds to collect same-model prompts across tables before sending.")
+@click.option("--batch-endpoint", default=None, help="Send each batch as one request to this OpenAI-compatible completions server.")
+def main(models, remote_seats, tables, rounds, elimination_count, stack, port, action_timeout, batch_window, batch_endpoint):
+    """
+    Host Texas Hold'em tables where remote clients play alongside LLMs.
+    Example:
+      llm_poker_server --models "gpt-5" --remote-seats 1 --tables 4
+    """
+    server = TableServer(
+        model_names=models.strip().split(),
+        remote_seats=remote_seats,
+        tables=tables,
+        rounds=rounds,
+        elimination_count=elimination_count,
+        starting_stack=stack,
+        action_timeout=action_timeout,
+        batch_window=batch_window,
+        port=port,
+        batch_endpoint=batch_endpoint,
+    )
+    asyncio.run(server.serve())
+
+
+if __name__ == "__main__":
+    main()
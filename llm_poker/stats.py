@@ -0,0 +1,210 @@
+# llm_poker/stats.py
+
+import math
+import threading
+from typing import Dict, List
+
+
+def model_key(player) -> str:
+    """Stats are aggregated per model; players without one are keyed by name."""
+    return getattr(player, "model_id", None) or player.name
+
+
+class ModelStats:
+    """
+    Constant-memory running aggregates for one model.
+    Counters are updated per event; bb/100 variance uses Welford's algorithm.
+    """
+
+    def __init__(self, rating: float = 1500.0):
+        self.hands = 0
+        self.vpip_hands = 0
+        self.pfr_hands = 0
+        self.postflop_raises = 0
+        self.postflop_calls = 0
+        self.showdowns = 0
+        self.showdown_wins = 0
+        self.net_bb_mean = 0.0
+        self.net_bb_m2 = 0.0
+        self.rating = rating
+
+    def add_hand_result(self, net_bb: float) -> None:
+        self.hands += 1
+        delta = net_bb - self.net_bb_mean
+        self.net_bb_mean += delta / self.hands
+        self.net_bb_m2 += delta * (net_bb - self.net_bb_mean)
+
+    def snapshot(self) -> Dict[str, float]:
+        hands = self.hands
+        variance = self.net_bb_m2 / (hands - 1) if hands > 1 else 0.0
+        return {
+            "hands": hands,
+            "vpip": self.vpip_hands / hands if hands else 0.0,
+            "pfr": self.pfr_hands / hands if hands else 0.0,
+            "af": (
+                self.postflop_raises / self.postflop_calls
+                if self.postflop_calls else float(self.postflop_raises)
+            ),
+            "showdowns": self.showdowns,
+            "showdown_win_rate": self.showdown_wins / self.showdowns if self.showdowns else 0.0,
+            "bb_per_100": self.net_bb_mean * 100,
+            # Standard deviation of the bb/100 estimate over a 100-hand sample.
+            "bb_per_100_std": math.sqrt(variance) * 10,
+            "rating": self.rating,
+        }
+
+    def to_dict(self) -> Dict[str, float]:
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, float]) -> "ModelStats":
+        stats = cls()
+        for key, value in data.items():
+            setattr(stats, key, value)
+        return stats
+
+
+class _HandState:
+    """Scratch state for the hand currently being played at one table."""
+
+    def __init__(self, big_blind: int, seat_models: Dict[str, str]):
+        self.big_blind = big_blind
+        self.seat_models = seat_models
+        self.vpip: set = set()
+        self.pfr: set = set()
+
+
+class StatsTracker:
+    """
+    Consumes PokerTable events as they happen and keeps per-model aggregates:
+    VPIP, PFR, postflop aggression factor, showdown win rate, bb/100 with its
+    variance, and a multiplayer Elo rating from pairwise hand results.
+
+    Memory is O(models + seats); nothing is retained between hands except the
+    running counters, so snapshot() is cheap at any point. One tracker can be
+    shared by tables playing on different threads: per-hand state is kept per
+    table and updates are serialized by a lock.
+    """
+
+    def __init__(self, k_factor: float = 16.0, initial_rating: float = 1500.0):
+        self.k_factor = k_factor
+        self.initial_rating = initial_rating
+        self.models: Dict[str, ModelStats] = {}
+        # Per-hand scratch state per table, dropped on every hand_end.
+        self._hands: Dict[int, _HandState] = {}
+        self._lock = threading.Lock()
+
+    def _stats_for(self, key: str) -> ModelStats:
+        stats = self.models.get(key)
+        if stats is None:
+            stats = self.models[key] = ModelStats(rating=self.initial_rating)
+        return stats
+
+    def handle_event(self, event: str, payload: Dict) -> None:
+        """Listener entry point, see PokerTable."""
+        with self._lock:
+            self._handle_event(event, payload)
+
+    def _handle_event(self, event: str, payload: Dict) -> None:
+        table_key = id(payload.get("table"))
+        if event == "hand_start":
+            self._hands[table_key] = _HandState(
+                big_blind=payload.get("big_blind") or 1,
+                seat_models={p.name: model_key(p) for p in payload["players"]},
+            )
+        elif event == "action":
+            self._on_action(self._hands[table_key], payload)
+        elif event == "showdown":
+            winners = {p.name for p in payload["winners"]}
+            for p in payload["players"]:
+                stats = self._stats_for(model_key(p))
+                stats.showdowns += 1
+                if p.name in winners:
+                    stats.showdown_wins += 1
+        elif event == "hand_end":
+            self._on_hand_end(self._hands.pop(table_key), payload["net"])
+
+    def _on_action(self, hand: "_HandState", payload: Dict) -> None:
+        player = payload["player"]
+        act = payload["action"]
+        if payload["stage"] == "preflop":
+            # A "call" of 0 is a check and is not voluntary money in the pot.
+            if act == "raise" or (act == "call" and payload["amount"] > 0):
+                hand.vpip.add(player.name)
+            if act == "raise":
+                hand.pfr.add(player.name)
+            return
+
+        stats = self._stats_for(model_key(player))
+        if act == "raise":
+            stats.postflop_raises += 1
+        elif act == "call" and payload["amount"] > 0:
+            stats.postflop_calls += 1
+
+    def _on_hand_end(self, hand: "_HandState", net: Dict[str, int]) -> None:
+        for name, chips in net.items():
+            stats = self._stats_for(hand.seat_models.get(name, name))
+            stats.add_hand_result(chips / hand.big_blind)
+            if name in hand.vpip:
+                stats.vpip_hands += 1
+            if name in hand.pfr:
+                stats.pfr_hands += 1
+        self._update_ratings(hand.seat_models, net)
+
+    def _update_ratings(self, seat_models: Dict[str, str], net: Dict[str, int]) -> None:
+        """
+        Treat each hand as a round-robin of pairwise games between seats of
+        different models, scored by net chips, with K split across opponents.
+        """
+        names = list(net)
+        if len(names) < 2:
+            return
+        k = self.k_factor / (len(names) - 1)
+        deltas: Dict[str, float] = {}
+        for i, a in enumerate(names):
+            for b in names[i + 1:]:
+                key_a = seat_models.get(a, a)
+                key_b = seat_models.get(b, b)
+                if key_a == key_b:
+                    continue
+                ra = self._stats_for(key_a).rating
+                rb = self._stats_for(key_b).rating
+                expected_a = 1.0 / (1.0 + 10 ** ((rb - ra) / 400.0))
+                if net[a] > net[b]:
+                    score_a = 1.0
+                elif net[a] < net[b]:
+                    score_a = 0.0
+                else:
+                    score_a = 0.5
+                change = k * (score_a - expected_a)
+                deltas[key_a] = deltas.get(key_a, 0.0) + change
+                deltas[key_b] = deltas.get(key_b, 0.0) - change
+        for key, change in deltas.items():
+            self.models[key].rating += change
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Current aggregates per model."""
+        with self._lock:
+            return {key: stats.snapshot() for key, stats in self.models.items()}
+
+    def state(self) -> Dict[str, Dict[str, float]]:
+        """Raw running counters, for checkpointing between hands."""
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self.models.items()}
+
+    def load_state(self, state: Dict[str, Dict[str, float]]) -> None:
+        with self._lock:
+            self.models = {key: ModelStats.from_dict(data) for key, data in state.items()}
+
+    @staticmethod
+    def format_snapshot(snapshot: Dict[str, Dict[str, float]]) -> str:
+        lines: List[str] = []
+        ranking = sorted(snapshot.items(), key=lambda kv: kv[1]["rating"], reverse=True)
+        for key, s in ranking:
+            lines.append(
+                f"{key}: rating {s['rating']:.0f} | hands {s['hands']} | "
+                f"VPIP {s['vpip']:.0%} | PFR {s['pfr']:.0%} | AF {s['af']:.2f} | "
+                f"SD win {s['showdown_win_rate']:.0%} ({s['showdowns']}) | "
+                f"{s['bb_per_100']:+.1f} bb/100 (± {s['bb_per_100_std']:.1f})"
+            )
+        return "\n".join(lines)
@@ -17,6 +17,8 @@ setup(
     entry_points={
         "console_scripts": [
             "llm_poker = llm_poker.cli:main",  
+            "llm_poker_server = llm_poker.server:main",
+            "llm_poker_grade = llm_poker.grading:main",
         ],
     },
     description="Texas Hold'em environment with LLM players",
@@ -0,0 +1,134 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+from llm_poker.batching import PromptBatcher, completions_dispatch
+from llm_poker.llm_player import LLMPlayer
+
+
+def test_batcher_groups_prompts_per_model():
+    batches = []
+    lock = threading.Lock()
+
+    def dispatch(model_id, prompts):
+        with lock:
+            batches.append((model_id, sorted(prompts)))
+        return [f"{model_id}:{p}" for p in prompts]
+
+    batcher = PromptBatcher(dispatch=dispatch, window=0.2)
+    futures = [batcher.submit("a", f"p{i}") for i in range(3)] + [batcher.submit("b", "q")]
+    results = [f.result(timeout=5) for f in futures]
+    batcher.close()
+
+    assert results == ["a:p0", "a:p1", "a:p2", "b:q"]
+    assert sorted(batches) == [("a", ["p0", "p1", "p2"]), ("b", ["q"])]
+
+
+def test_batcher_flushes_full_batch_and_propagates_errors():
+    def dispatch(model_id, prompts):
+        raise ValueError("provider down")
+
+    batcher = PromptBatcher(dispatch=dispatch, window=60, max_batch=2)
+    futures = [batcher.submit("a", "x"), batcher.submit("a", "y")]
+    for f in futures:
+        with pytest.raises(ValueError):
+            f.result(timeout=5)
+    batcher.close()
+
+
+def test_llm_player_sends_through_batcher():
+    class FakeBatcher:
+        def __init__(self):
+            self.calls = []
+
+        def prompt(self, model_id, prompt):
+            self.calls.append(model_id)
+            return '{"action": "call", "raise_amount": null}'
+
+    batcher = FakeBatcher()
+    player = LLMPlayer("P", model_id="not-a-registered-model", batcher=batcher)
+    action = player.request_action([], pot=150, call_amount=100, min_raise=500, game_history="")
+
+    assert action == {"action": "call", "raise_amount": None}
+    assert batcher.calls == ["not-a-registered-model"]
+
+
+def test_batcher_resolves_each_prompt_with_its_own_outcome():
+    def dispatch(model_id, prompts):
+        return [ConnectionError("provider hiccup") if p == "bad" else p.upper() for p in prompts]
+
+    batcher = PromptBatcher(dispatch=dispatch, window=60, max_batch=3)
+    futures = [batcher.submit("a", p) for p in ("ok", "bad", "fine")]
+    assert futures[0].result(timeout=5) == "OK"
+    assert futures[2].result(timeout=5) == "FINE"
+    with pytest.raises(ConnectionError):
+        futures[1].result(timeout=5)
+    batcher.close()
+
+
+class _CompletionsStub(BaseHTTPRequestHandler):
+    requests = []
+    drop_last = False
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        type(self).requests.append((self.path, body))
+        prompts = body["prompt"]
+        if type(self).drop_last:
+            prompts = prompts[:-1]
+        # Answer out of order to check results are matched by index.
+        choices = [{"index": i, "text": f"{body['model']}:{p}"} for i, p in enumerate(prompts)][::-1]
+        data = json.dumps({"choices": choices}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def completions_server():
+    _CompletionsStub.requests = []
+    _CompletionsStub.drop_last = False
+    server = HTTPServer(("127.0.0.1", 0), _CompletionsStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_completions_dispatch_sends_one_request_per_batch(completions_server):
+    batcher = PromptBatcher(dispatch=completions_dispatch(completions_server), window=0.2)
+    futures = [batcher.submit("local-model", f"p{i}") for i in range(3)]
+    assert [f.result(timeout=5) for f in futures] == ["local-model:p0", "local-model:p1", "local-model:p2"]
+    batcher.close()
+
+    assert len(_CompletionsStub.requests) == 1
+    path, body = _CompletionsStub.requests[0]
+    assert path == "/v1/completions"
+    assert sorted(body["prompt"]) == ["p0", "p1", "p2"]
+
+
+def test_completions_dispatch_rejects_short_response(completions_server):
+    _CompletionsStub.drop_last = True
+    dispatch = completions_dispatch(completions_server)
+    with pytest.raises(RuntimeError, match="no completion"):
+        dispatch("local-model", ["a", "b"])
+
+
+def test_cli_passes_batch_endpoint(monkeypatch):
+    from llm_poker import cli
+
+    captured = {}
+    monkeypatch.setattr(cli, "simulate_poker_tables", lambda **kwargs: captured.update(kwargs))
+    result = CliRunner().invoke(cli.main, ["--batch-endpoint", "http://localhost:8000"])
+    assert result.exit_code == 0, result.output
+    assert captured["batch_endpoint"] == "http://localhost:8000"
+    assert captured["tables"] == 1
@@ -0,0 +1,106 @@
+import json
+import random
+
+import pytest
+
+from llm_poker.checkpoint import capture_session, load_checkpoint, restore_rng, save_checkpoint
+from llm_poker.environment import PokerTable, simulate_poker_game
+from llm_poker.human_player import HumanPlayer
+from llm_poker.llm_player import LLMPlayer
+from llm_poker.stats import StatsTracker
+
+
+def test_checkpoint_roundtrip_restores_rng_and_table(tmp_path):
+    path = tmp_path / "session.json"
+    table = PokerTable([HumanPlayer("Human", stack=1234)])
+    table.button_position = 0
+    stats = StatsTracker()
+    stats.handle_event("hand_start", {"players": table.players, "big_blind": 100})
+    stats.handle_event("hand_end", {"net": {"Human": 100}})
+
+    random.seed(42)
+    save_checkpoint(str(path), capture_session(table, 7, stats))
+    expected = [random.random() for _ in range(3)]
+
+    state = load_checkpoint(str(path))
+    assert state["hand_number"] == 7
+    assert state["players"] == [{"name": "Human", "model_id": "Human", "stack": 1234, "human": True}]
+    assert list(tmp_path.iterdir()) == [path]  # no temp files left behind
+
+    restore_rng(state)
+    assert [random.random() for _ in range(3)] == expected
+
+    restored = StatsTracker()
+    restored.load_state(state["stats"])
+    assert restored.snapshot() == stats.snapshot()
+
+
+def test_load_checkpoint_missing_returns_none(tmp_path):
+    assert load_checkpoint(str(tmp_path / "missing.json")) is None
+
+
+def test_simulate_resumes_seats_from_checkpoint(tmp_path, capsys):
+    path = tmp_path / "session.json"
+    table = PokerTable([HumanPlayer("Human", stack=4321)])
+    save_checkpoint(str(path), capture_session(table, 2, StatsTracker()))
+
+    simulate_poker_game(
+        model_names=[],
+        rounds=5,
+        elimination_count=1,
+        starting_stack=1000,
+        checkpoint_path=str(path),
+        resume=True,
+    )
+
+    out = capsys.readouterr().out
+    assert "Resuming from" in out
+    assert "Human (Human): $4321" in out
+    assert json.loads(path.read_text())["hand_number"] == 2
+
+
+def test_resume_warns_about_ignored_options(tmp_path, capsys):
+    path = tmp_path / "session.json"
+    table = PokerTable([HumanPlayer("Human", stack=4321)])
+    save_checkpoint(str(path), capture_session(table, 2, StatsTracker(), starting_stack=5000))
+
+    simulate_poker_game(
+        model_names=["gpt-5"],
+        rounds=5,
+        elimination_count=1,
+        starting_stack=1000,
+        human_player=False,
+        checkpoint_path=str(path),
+        resume=True,
+    )
+
+    out = capsys.readouterr().out
+    assert "ignoring models 'gpt-5'" in out
+    assert "ignoring human player False" in out
+    assert "ignoring starting stack 1000 (checkpoint has 5000)" in out
+
+
+def test_unwritable_checkpoint_fails_before_first_hand(tmp_path):
+    path = tmp_path / "missing_dir" / "session.json"
+    with pytest.raises(OSError):
+        simulate_poker_game(
+            model_names=[],
+            rounds=1,
+            elimination_count=0,
+            human_player=True,
+            checkpoint_path=str(path),
+        )
+
+
+def test_provider_error_prints_resume_hint(tmp_path, capsys, monkeypatch):
+    def provider_down(self, *args, **kwargs):
+        raise ConnectionError("provider unreachable")
+
+    monkeypatch.setattr("llm_poker.llm_player.llm.get_model", lambda model_id: None)
+    monkeypatch.setattr(LLMPlayer, "request_action", provider_down)
+    path = tmp_path / "session.json"
+    with pytest.raises(ConnectionError):
+        simulate_poker_game(model_names=["a", "b"], rounds=3, checkpoint_path=str(path))
+
+    assert "rerun with --resume" in capsys.readouterr().out
+    assert json.loads(path.read_text())["hand_number"] == 0
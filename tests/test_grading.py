@@ -0,0 +1,139 @@
+import json
+import random
+
+import pytest
+
+from llm_poker.cards import parse_card
+from llm_poker.environment import PokerTable
+from llm_poker.grading import (
+    DecisionRecorder,
+    estimate_equity,
+    format_summary,
+    grade_decision,
+    grade_decisions,
+    read_decisions,
+    summarize,
+)
+from llm_poker.player import Player
+
+
+class CallingPlayer(Player):
+    def request_action(self, community_cards, pot, call_amount, min_raise, game_history):
+        return {"action": "call", "raise_amount": None}
+
+
+def cards(*names):
+    return [parse_card(n) for n in names]
+
+
+def test_equity_estimates():
+    rng = random.Random(0)
+    aces = estimate_equity(cards("14♠", "14♥"), [], 1, 400, rng)
+    assert 0.78 < aces < 0.92
+    royal = estimate_equity(cards("14♠", "13♠"), cards("12♠", "11♠", "10♠"), 3, 50, rng)
+    assert royal == 1.0
+
+
+def test_folding_the_nuts_is_minus_ev():
+    record = {
+        "model": "m", "stage": "flop", "action": "fold", "amount": 0,
+        "hole_cards": ["14♠", "13♠"], "community_cards": ["12♠", "11♠", "10♠"],
+        "pot": 1000, "call_amount": 200, "min_raise": 500, "opponents": 1, "big_blind": 100,
+    }
+    graded = grade_decision(record, 50, random.Random(0))
+    assert graded["plus_ev"] is False
+    assert graded["ev_loss"] == 1000
+    assert graded["ev_loss_bb"] == 10
+    assert abs(graded["pot_odds"] - 200 / 1200) < 1e-9
+
+    record["action"] = "call"
+    assert grade_decision(record, 50, random.Random(0))["plus_ev"] is True
+
+
+def test_recorded_run_grades_the_same_in_process_and_in_parallel(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    recorder = DecisionRecorder(str(path))
+    random.seed(5)
+    table = PokerTable([CallingPlayer("A"), CallingPlayer("B"), CallingPlayer("C")],
+                       min_raise=100, small_blind=50, big_blind=100,
+                       listeners=[recorder.handle_event])
+    for _ in range(2):
+        table.play_hand()
+    recorder.close()
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert lines and all(line["model"] in ("A", "B", "C") for line in lines)
+    assert all(len(line["hole_cards"]) == 2 for line in lines)
+
+    serial = list(grade_decisions(read_decisions(str(path)), samples=20, batch_size=3, workers=1))
+    parallel = list(grade_decisions(read_decisions(str(path)), samples=20, batch_size=3, workers=2))
+    assert serial == parallel
+
+    summary = summarize(serial)
+    assert sum(row["all"]["decisions"] for row in summary.values()) == len(serial)
+    assert "preflop" in format_summary(summary)
+
+
+def test_raise_worse_than_calling_is_minus_ev():
+    record = {
+        "model": "m", "stage": "preflop", "action": "raise", "amount": 2000,
+        "hole_cards": ["2♣", "7♦"], "community_cards": [],
+        "pot": 1000, "call_amount": 100, "min_raise": 500, "opponents": 1, "big_blind": 100,
+    }
+    graded = grade_decision(record, 400, random.Random(0))
+    equity = graded["equity"]
+    ev_call = equity * 1100 - 100
+    ev_raise = equity * 3000 - 2000
+    assert ev_raise < ev_call
+    assert graded["plus_ev"] is False
+    assert abs(graded["ev_loss"] - (ev_call - ev_raise)) < 1e-6
+
+    # With the nuts, raising is as good as calling.
+    record.update(action="raise", hole_cards=["14♠", "13♠"], community_cards=["12♠", "11♠", "10♠"], stage="flop")
+    assert grade_decision(record, 50, random.Random(0))["plus_ev"] is True
+
+
+def test_recorded_opponents_exclude_all_in_seats():
+    events = []
+    random.seed(3)
+    table = PokerTable([CallingPlayer("A", stack=100), CallingPlayer("B"), CallingPlayer("C")],
+                       min_raise=100, small_blind=50, big_blind=100,
+                       listeners=[lambda event, payload: events.append((event, payload))])
+    table.play_hand()
+    actions = [p for e, p in events if e == "action"]
+    short = table.players[0]
+    all_in = next(i for i, p in enumerate(actions) if p["player"] is short)
+    later = [p for p in actions[all_in + 1:] if p["player"] is not short]
+    assert later
+    # A has no chips left to bet with, so only one seat is still contesting.
+    assert all(p["opponents"] == 1 for p in later)
+
+
+def test_recorder_drops_decisions_of_a_hand_that_raises(tmp_path):
+    path = tmp_path / "decisions.jsonl"
+    recorder = DecisionRecorder(str(path))
+    calls = []
+    fail = {"now": True}
+
+    class FlakyPlayer(CallingPlayer):
+        def request_action(self, *args, **kwargs):
+            calls.append(self.name)
+            if len(calls) == 2 and fail["now"]:
+                raise ConnectionError("provider unreachable")
+            return super().request_action(*args, **kwargs)
+
+    random.seed(7)
+    table = PokerTable([FlakyPlayer("A"), FlakyPlayer("B")],
+                       min_raise=100, small_blind=50, big_blind=100,
+                       listeners=[recorder.handle_event])
+    with pytest.raises(ConnectionError):
+        table.play_hand()
+    # One decision was taken before the hand failed, but none is written.
+    assert path.read_text(encoding="utf-8") == ""
+
+    # Replaying the hand records only the replay's decisions.
+    fail["now"] = False
+    table.play_hand()
+    recorder.close()
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == len(calls) - 2
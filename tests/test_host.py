@@ -0,0 +1,125 @@
+import random
+import threading
+
+import pytest
+
+from llm_poker.cards import card_str, create_deck, parse_card, score_best_5_of_7
+from llm_poker.environment import PokerTable
+from llm_poker.host import TableHost, table_footprint
+from llm_poker.human_player import HumanPlayer
+from llm_poker.player import Player
+
+
+class CallingPlayer(Player):
+    __slots__ = ()
+
+    def request_action(self, community_cards, pot, call_amount, min_raise, game_history):
+        assert all(isinstance(c, str) for c in community_cards)
+        return {"action": "call", "raise_amount": None}
+
+
+def test_integer_cards_roundtrip_and_scoring():
+    deck = create_deck()
+    assert len(set(deck)) == 52
+    assert all(parse_card(card_str(c)) == c for c in deck)
+    assert card_str(parse_card("14♥")) == "14♥"
+
+    quads = [parse_card(c) for c in ["9♣", "9♦", "9♥", "9♠", "2♣", "3♦", "5♥"]]
+    flush = [parse_card(c) for c in ["2♥", "7♥", "9♥", "11♥", "13♥", "3♦", "5♣"]]
+    assert score_best_5_of_7(quads)[0] == 7
+    assert score_best_5_of_7(flush)[0] == 5
+
+
+def test_players_and_tables_are_slotted():
+    player = HumanPlayer("Human")
+    table = PokerTable([player])
+    assert not hasattr(player, "__dict__")
+    assert not hasattr(table, "__dict__")
+    assert table_footprint(table) > 0
+
+
+def test_host_respects_in_flight_limit_and_finishes_all_tables():
+    random.seed(3)
+    created = []
+    live = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def make_table(t):
+        created.append(t)
+        table = PokerTable([CallingPlayer(f"T{t}_A", 1000), CallingPlayer(f"T{t}_B", 1000)],
+                           min_raise=100, small_blind=50, big_blind=100)
+        with lock:
+            live["now"] += 1
+            live["peak"] = max(live["peak"], live["now"])
+        return table
+
+    hands = []
+    host = TableHost(make_table, max_tables=4, workers=2)
+    finished = []
+    for t, table in host.run(20, hands_per_table=3, on_hand=lambda t, h: hands.append(t)):
+        finished.append(t)
+        with lock:
+            live["now"] -= 1
+
+    assert sorted(finished) == list(range(20))
+    assert created == list(range(20))
+    assert live["peak"] <= 4
+    assert len(hands) == 60
+
+
+def test_host_memory_budget_caps_capacity():
+    def make_table(t):
+        return PokerTable([CallingPlayer("A", 1000), CallingPlayer("B", 1000)])
+
+    sample = make_table(0)
+    host = TableHost(make_table, max_tables=1000, memory_budget=table_footprint(sample) * 3)
+    assert host._capacity(sample) == 3
+
+
+class FailingPlayer(Player):
+    __slots__ = ()
+
+    def request_action(self, community_cards, pot, call_amount, min_raise, game_history):
+        raise RuntimeError("provider outage")
+
+
+def test_host_cancels_queued_hands_when_a_hand_fails():
+    decisions = []
+    gate = threading.Event()
+    stop = threading.Event()
+
+    class GatedPlayer(CallingPlayer):
+        __slots__ = ()
+
+        def request_action(self, *args, **kwargs):
+            gate.wait()
+            decisions.append(self.name)
+            return super().request_action(*args, **kwargs)
+
+    def make_table(t):
+        cls = FailingPlayer if t == 1 else GatedPlayer
+        return PokerTable([cls(f"T{t}_A", 1000), cls(f"T{t}_B", 1000)],
+                          min_raise=100, small_blind=50, big_blind=100)
+
+    # Table 0's hand holds one worker until table 1 has failed on the other.
+    threading.Thread(target=lambda: stop.wait() and gate.set(), daemon=True).start()
+    host = TableHost(make_table, max_tables=200, workers=2)
+    with pytest.raises(RuntimeError, match="provider outage"):
+        list(host.run(200, hands_per_table=5, stop=stop))
+    # Only the hand already running when table 1 failed was played.
+    assert decisions and {name.split("_")[0] for name in decisions} == {"T0"}
+
+
+def test_host_cancels_queued_hands_when_caller_stops():
+    played = []
+
+    def make_table(t):
+        table = PokerTable([CallingPlayer("A", 100), CallingPlayer("B", 1000)],
+                           min_raise=100, small_blind=50, big_blind=100)
+        return table
+
+    host = TableHost(make_table, max_tables=100, workers=2)
+    results = host.run(100, hands_per_table=1, on_hand=lambda t, h: played.append(t))
+    next(results)
+    results.close()
+    assert len(played) < 10
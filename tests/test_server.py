@@ -0,0 +1,120 @@
+import asyncio
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+from llm_poker.remote_player import RemotePlayer
+from llm_poker.server import TableServer
+
+
+def test_remote_player_accepts_pending_action_and_rejects_stale():
+    seat = RemotePlayer("R", action_timeout=5)
+    result = {}
+    t = threading.Thread(target=lambda: result.update(seat.request_action(["2♣"], 150, 100, 500, "h")))
+    t.start()
+    while seat.pending_decision() is None:
+        time.sleep(0.01)
+    pending = seat.pending_decision()
+    assert pending["community_cards"] == ["2♣"]
+    assert seat.submit_action(pending["decision_id"] + 1, "call") is False
+    assert seat.submit_action(pending["decision_id"], "raise", 600) is True
+    t.join(timeout=5)
+    assert result == {"action": "raise", "raise_amount": 600}
+    assert seat.pending_decision() is None
+
+
+def test_remote_player_auto_folds_on_timeout():
+    seat = RemotePlayer("R", action_timeout=0.05)
+    assert seat.request_action([], 150, 100, 500, "h") == {"action": "fold", "raise_amount": None}
+    assert seat.pending_decision() is None
+
+
+def _request(port, method, path, body=None):
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(f"http://127.0.0.1:{port}{path}", data=data, method=method)
+    try:
+        with urllib.request.urlopen(req, timeout=2) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_server_plays_table_with_remote_clients():
+    server = TableServer(model_names=[], remote_seats=2, tables=1, rounds=1, port=0, action_timeout=10)
+    thread = threading.Thread(target=lambda: asyncio.run(server.serve()), daemon=True)
+    thread.start()
+
+    deadline = time.monotonic() + 10
+    while server.port == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    port = server.port
+
+    assert _request(port, "GET", "/tables/99/seats/nobody")[0] == 404
+    status, data = _request(port, "GET", "/tables/0/seats/T1_Remote_1?wait=1")
+    pending = data["pending"] or _request(port, "GET", "/tables/0/seats/T1_Remote_2?wait=1")[1]["pending"]
+    # Opponents' hole cards are never shown to a remote client.
+    assert pending["game_history"].count("hole cards") == 1
+
+    while thread.is_alive() and time.monotonic() < deadline:
+        try:
+            for name in ("T1_Remote_1", "T1_Remote_2"):
+                status, data = _request(port, "GET", f"/tables/0/seats/{name}?wait=0.1")
+                if status == 200 and data["pending"]:
+                    decision = {"decision_id": data["pending"]["decision_id"], "action": "call"}
+                    assert _request(port, "POST", f"/tables/0/seats/{name}/action", decision)[0] == 200
+                    assert _request(port, "POST", f"/tables/0/seats/{name}/action", decision)[0] == 409
+        except OSError:
+            break  # the server stops once every table is finished
+
+    thread.join(timeout=10)
+    tables = server.list_tables()
+    assert tables[0]["finished"]
+    assert tables[0]["hands_played"] == 1
+    assert sum(seat["stack"] for seat in tables[0]["seats"]) == 20000
+
+
+def test_remote_player_close_fails_pending_decision():
+    seat = RemotePlayer("R", action_timeout=20)
+    errors = []
+
+    def wait():
+        try:
+            seat.request_action([], 150, 100, 500, "h")
+        except RuntimeError as e:
+            errors.append(e)
+
+    t = threading.Thread(target=wait)
+    t.start()
+    while seat.pending_decision() is None:
+        time.sleep(0.01)
+    seat.close()
+    t.join(timeout=2)
+    assert not t.is_alive() and errors
+    assert seat.pending_decision() is None
+
+
+def test_cancelling_serve_stops_play_promptly():
+    server = TableServer(model_names=[], remote_seats=2, tables=2, rounds=5, port=0, action_timeout=20)
+
+    def waiting():
+        with server._lock:
+            tables = list(server._tables.values())
+        return any(isinstance(p, RemotePlayer) and p.pending_decision() for t in tables for p in t.players)
+
+    async def run_and_cancel():
+        task = asyncio.ensure_future(server.serve())
+        while not waiting():
+            await asyncio.sleep(0.01)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    start = time.monotonic()
+    asyncio.run(run_and_cancel())
+    # asyncio.run waits for the executor thread; the seats' 20 s wait must not.
+    assert time.monotonic() - start < 5
+    assert all(table["hands_played"] == 0 for table in server.list_tables())
@@ -0,0 +1,78 @@
+import random
+import threading
+import time
+from concurrent.futures import Future
+
+from llm_poker.environment import PokerTable
+from llm_poker.player import Player
+
+
+class PolicyPlayer(Player):
+    """Stateless policy so a discarded speculative request has no side effects."""
+
+    supports_speculation = True
+
+    def __init__(self, name, raise_below_pot=0, stack=10000):
+        super().__init__(name, stack)
+        self.raise_below_pot = raise_below_pot
+        self.threads = set()
+
+    def request_action(self, community_cards, pot, call_amount, min_raise, game_history):
+        self.threads.add(threading.current_thread().name)
+        if pot < self.raise_below_pot:
+            return {"action": "raise", "raise_amount": None}
+        return {"action": "call", "raise_amount": None}
+
+
+def play(speculate):
+    random.seed(7)
+    players = [PolicyPlayer("A"), PolicyPlayer("B", raise_below_pot=400), PolicyPlayer("C")]
+    table = PokerTable(players, min_raise=100, small_blind=50, big_blind=100, speculate=speculate)
+    histories = [table.play_hand() for _ in range(3)]
+    return table, players, histories
+
+
+def test_speculation_preserves_outcome_and_hits():
+    _, plain_players, plain_histories = play(speculate=False)
+    table, spec_players, spec_histories = play(speculate=True)
+
+    assert spec_histories == plain_histories
+    assert [p.stack for p in spec_players] == [p.stack for p in plain_players]
+    assert table.speculation_hits > 0
+    assert table.speculation_misses > 0  # B's raises invalidate the call guess
+    assert any(name.startswith("speculate") for p in spec_players for name in p.threads)
+
+
+def test_players_without_support_are_never_prefetched():
+    random.seed(7)
+    players = [PolicyPlayer("A"), PolicyPlayer("B"), PolicyPlayer("C")]
+    for p in players:
+        p.supports_speculation = False
+    table = PokerTable(players, min_raise=100, small_blind=50, big_blind=100, speculate=True)
+    table.play_hand()
+    assert table.speculation_hits == 0
+    assert all(not name.startswith("speculate") for p in players for name in p.threads)
+
+
+def test_speculation_threads_do_not_outlive_the_hand():
+    before = threading.active_count()
+    random.seed(7)
+    for _ in range(30):
+        players = [PolicyPlayer("A"), PolicyPlayer("B"), PolicyPlayer("C")]
+        table = PokerTable(players, min_raise=100, small_blind=50, big_blind=100, speculate=True)
+        table.play_hand()
+        assert table.speculation_hits > 0
+    deadline = time.monotonic() + 5
+    while threading.active_count() > before and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert threading.active_count() <= before
+
+
+def test_no_speculation_while_workers_are_busy():
+    random.seed(7)
+    players = [PolicyPlayer("A"), PolicyPlayer("B"), PolicyPlayer("C")]
+    table = PokerTable(players, min_raise=100, small_blind=50, big_blind=100, speculate=True)
+    table._speculating = [Future(), Future()]  # two discarded requests still running
+    table.play_hand()
+    assert table.speculation_hits == 0
+    assert all(not name.startswith("speculate") for p in players for name in p.threads)
@@ -0,0 +1,51 @@
+import random
+
+from llm_poker.environment import PokerTable
+from llm_poker.player import Player
+from llm_poker.stats import StatsTracker
+
+
+class ScriptedPlayer(Player):
+    def __init__(self, name, model_id, actions, stack=10000):
+        super().__init__(name, stack)
+        self.model_id = model_id
+        self.actions = list(actions)
+
+    def request_action(self, community_cards, pot, call_amount, min_raise, game_history):
+        act = self.actions.pop(0) if self.actions else "call"
+        return {"action": act, "raise_amount": None}
+
+
+def test_stats_track_preflop_fold_and_rating():
+    random.seed(0)
+    stats = StatsTracker()
+    # Heads-up with the button at seat 1, seat 2 is first to act preflop.
+    folder = ScriptedPlayer("B", "model-b", ["fold"])
+    raiser = ScriptedPlayer("A", "model-a", ["raise"])
+    table = PokerTable([folder, raiser], min_raise=500, small_blind=50, big_blind=100,
+                       listeners=[stats.handle_event])
+    table.play_hand()
+
+    snap = stats.snapshot()
+    assert snap["model-a"]["hands"] == 1
+    assert snap["model-a"]["vpip"] == 1.0
+    assert snap["model-a"]["pfr"] == 1.0
+    assert snap["model-b"]["vpip"] == 0.0
+    assert snap["model-a"]["bb_per_100"] > 0
+    assert snap["model-a"]["rating"] > snap["model-b"]["rating"]
+    assert "model-a" in StatsTracker.format_snapshot(snap)
+
+
+def test_stats_bb_per_100_variance_is_running():
+    stats = StatsTracker()
+    seat_a = ScriptedPlayer("A", "m", [])
+    stats.handle_event("hand_start", {"players": [seat_a], "big_blind": 100})
+    stats.handle_event("hand_end", {"net": {"A": 200}})
+    stats.handle_event("hand_start", {"players": [seat_a], "big_blind": 100})
+    stats.handle_event("hand_end", {"net": {"A": -200}})
+
+    snap = stats.snapshot()["m"]
+    assert snap["hands"] == 2
+    assert snap["bb_per_100"] == 0
+    # sample std of [2, -2] bb is 2.828..., scaled by sqrt(100)
+    assert abs(snap["bb_per_100_std"] - 28.284) < 0.01